@@ -0,0 +1,27 @@
+"""add users version
+
+Revision ID: 3b7e5f0a1c92
+Revises: 9c3f1d2e6a84
+Create Date: 2026-10-18 14:05:12.381940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e5f0a1c92'
+down_revision: Union[str, None] = '9c3f1d2e6a84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,41 @@
+"""add user listing indexes
+
+Revision ID: 5e0c4b9a7f21
+Revises: d7225eb6bb36
+Create Date: 2026-10-18 11:02:17.530941
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0c4b9a7f21'
+down_revision: Union[str, None] = 'd7225eb6bb36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Prefix (LIKE 'abc%') filters can only use a PostgreSQL btree built with
+# text_pattern_ops unless the database runs with the C collation. Paging
+# itself seeks on the unique email index.
+PATTERN_INDEXES = {
+    'ix_users_email_pattern': 'email text_pattern_ops',
+    'ix_users_first_name_pattern': 'lower(first_name) text_pattern_ops',
+    'ix_users_last_name_pattern': 'lower(last_name) text_pattern_ops',
+}
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_users_date_of_birth'), 'users', ['date_of_birth'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, expression in PATTERN_INDEXES.items():
+            op.create_index(name, 'users', [sa.text(expression)], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for name in PATTERN_INDEXES:
+            op.drop_index(name, table_name='users')
+    op.drop_index(op.f('ix_users_date_of_birth'), table_name='users')
@@ -0,0 +1,32 @@
+"""add revoked_tokens created_at
+
+Revision ID: 6d2b8e4f1a37
+Revises: 3b7e5f0a1c92
+Create Date: 2026-10-18 15:10:41.207318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2b8e4f1a37'
+down_revision: Union[str, None] = '3b7e5f0a1c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite can't ALTER in a column with a non-constant default; batch
+    # mode copies the table there instead.
+    with op.batch_alter_table('revoked_tokens') as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+        batch_op.create_index(batch_op.f('ix_revoked_tokens_created_at'), ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('revoked_tokens') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_revoked_tokens_created_at'))
+        batch_op.drop_column('created_at')
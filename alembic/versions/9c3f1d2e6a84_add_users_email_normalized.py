@@ -0,0 +1,41 @@
+"""add users email_normalized
+
+Revision ID: 9c3f1d2e6a84
+Revises: 5e0c4b9a7f21
+Create Date: 2026-10-18 12:20:45.904316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3f1d2e6a84'
+down_revision: Union[str, None] = '5e0c4b9a7f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('email_normalized', sa.String(), nullable=True))
+    # Emails are validated as ASCII, where SQL lower() and Python's
+    # str.lower() agree. Accounts that only differ in case make the
+    # unique index below fail; they have to be merged by hand first.
+    op.execute('UPDATE users SET email_normalized = lower(trim(email))')
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('email_normalized', existing_type=sa.String(), nullable=False)
+    op.create_index(op.f('ix_users_email_normalized'), 'users', ['email_normalized'], unique=True)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_users_email_pattern', table_name='users')
+        op.create_index('ix_users_email_normalized_pattern', 'users', [sa.text('email_normalized text_pattern_ops')], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_users_email_normalized_pattern', table_name='users')
+        op.create_index('ix_users_email_pattern', 'users', [sa.text('email text_pattern_ops')], unique=False)
+    op.drop_index(op.f('ix_users_email_normalized'), table_name='users')
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('email_normalized')
@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.repository import AuthRepository
-from app.auth.schemas import AccessToken, RequestPasswordResetSchema, ResetPasswordSchema
-from app.system.database.connection import get_db
+from app.auth.schemas import (
+    AccessToken,
+    RefreshTokenSchema,
+    RequestPasswordResetSchema,
+    ResetPasswordSchema,
+    RevokeTokenSchema,
+)
+from app.config.settings import get_config
+from app.system.database.connection import get_db, get_read_db
+from app.system.responses.json_response import FastJSONResponse
+from app.system.security.keys import key_ring
 
 router = APIRouter(prefix='/auth', tags=['Auth'])
 
+JWKS_CACHE_MAX_AGE = get_config().JWKS_CACHE_MAX_AGE
+
 
 @router.post(
     '/',
@@ -18,15 +30,55 @@ router = APIRouter(prefix='/auth', tags=['Auth'])
     response_model=AccessToken,
 )
 async def auth(
+    background_tasks: BackgroundTasks,
     login_request_form: OAuth2PasswordRequestForm = Depends(),
     db_session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
 ):
-    repository = AuthRepository(db_session)
+    repository = AuthRepository(db_session, read_session=read_session)
     token_data = await repository.authenticate(
-        email=login_request_form.username, password=login_request_form.password
+        email=login_request_form.username,
+        password=login_request_form.password,
+        background_tasks=background_tasks,
+    )
+
+    return FastJSONResponse(token_data)
+
+
+@router.post(
+    '/refresh',
+    summary='Exchange a refresh token for new tokens',
+    description="""
+            Refresh tokens are single use: each call returns a new
+            access token and a new refresh token.
+            """,
+    response_model=AccessToken,
+)
+async def refresh(
+    refresh_request: RefreshTokenSchema,
+    db_session: AsyncSession = Depends(get_db),
+):
+    repository = AuthRepository(db_session)
+    return FastJSONResponse(
+        await repository.refresh(refresh_request.refresh_token)
     )
 
-    return token_data
+
+@router.post(
+    '/revoke',
+    summary='Revoke an access or refresh token',
+    description="""
+            Revoking a refresh token also revokes every token issued
+            from the same login.
+            """,
+)
+async def revoke(
+    revoke_request: RevokeTokenSchema,
+    db_session: AsyncSession = Depends(get_db),
+):
+    repository = AuthRepository(db_session)
+    await repository.revoke_token(revoke_request.token)
+    return {'message': 'token revoked'}
 
 
 @router.post(
@@ -66,3 +118,19 @@ async def change_password(
         'message ': 'password changed successfully'
     }
 
+
+@router.get(
+    '/.well-known/jwks.json',
+    summary='Public keys used to sign access tokens',
+    description="""
+            JSON Web Key Set for verifying access tokens locally.
+            Empty when tokens are signed with a shared secret.
+            """,
+)
+async def jwks():
+    return JSONResponse(
+        content=key_ring.jwks(),
+        headers={
+            'Cache-Control': f'public, max-age={JWKS_CACHE_MAX_AGE}',
+        },
+    )
@@ -1,45 +1,128 @@
+import secrets
+import uuid
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from uuid import UUID
 
 from dotenv import load_dotenv
-from fastapi import HTTPException, status
-from jose import jwt
+from fastapi import BackgroundTasks, HTTPException, status
+from jose import JWTError
+from sqlalchemy import Row, bindparam, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.auth.models import RefreshToken
+from app.auth.revocation import revocation_list, token_digest
 from app.auth.schemas import AccessToken
 from app.config.settings import get_config
-from app.system.security.security import verify_password, get_password_hash
+from app.system.cache.single_flight import SingleFlight
+from app.system.database.connection import read_router, warm_up_statement
+from app.system.database.lazy_session import release_connection
+from app.system.metrics.registry import register
+from app.system.security.keys import key_ring
+from app.system.security.security import (
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.user.models import ResetPasswordToken, User
 from app.user.repository import UserRepository
+from app.user.utils.calculate_expires_date import expires_date, is_expired
+from app.user.utils.validators import normalize_email
 
 load_dotenv()
 token_expires_in = int(get_config().AUTH_TOKEN_EXPIRES)
+refresh_token_expires_in = get_config().REFRESH_TOKEN_EXPIRES
 ALGORITHM = get_config().ALGORITHM
 SECRET_KEY = get_config().SECRET_KEY
 
+reset_token_lookups = SingleFlight()
+register('reset_token_lookups', reset_token_lookups.stats)
+
+_users = User.__table__
+
+# Core select over table columns, built once: it skips the ORM entity
+# machinery, and executing the same object every time lets SQLAlchemy
+# reuse its cache key and compiled SQL instead of rebuilding them.
+LOGIN_QUERY = select(
+    _users.c.uuid,
+    _users.c.password,
+    _users.c.first_name,
+    _users.c.last_name,
+    _users.c.email,
+).where(_users.c.email_normalized == bindparam('email'))
+warm_up_statement(LOGIN_QUERY, {'email': ''})
+
 
 class AuthRepository:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        read_session: AsyncSession | None = None,
+    ):
         self.db_session = db_session
+        # Only the login lookup reads from here; see authenticate.
+        self.read_session = read_session or db_session
+
+    @staticmethod
+    async def _select_login(session: AsyncSession, email: str) -> Row | None:
+        connection = await session.connection()
+        result = await connection.execute(LOGIN_QUERY, {'email': email})
+        row = result.one_or_none()
+        # Verifying the password takes far longer than the query; don't
+        # keep the connection out meanwhile.
+        await release_connection(session)
+        return row
 
     # TODO: improve this function
-    async def authenticate(self, email: str, password: str):
-        result = await self.db_session.execute(
-            select(User).filter_by(email=email)
+    async def authenticate(
+        self,
+        email: str,
+        password: str,
+        background_tasks: BackgroundTasks | None = None,
+    ):
+        email = normalize_email(email)
+        user = await self._select_login(self.read_session, email)
+        verified = user is not None and await verify_password_async(
+            password, str(user.password)
         )
-        user = result.scalar_one_or_none()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail='Incorrect username or password.',
-            )
+        if not verified and read_router.replicas:
+            # The replica may not have caught up with a new account or a
+            # password change yet. Only a different hash on the primary
+            # is worth verifying again.
+            primary_user = await self._select_login(self.db_session, email)
+            if primary_user is not None and (
+                user is None or primary_user.password != user.password
+            ):
+                user = primary_user
+                verified = await verify_password_async(
+                    password, str(user.password)
+                )
 
-        if not verify_password(password, str(user.password)):
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail='Incorrect username or password.',
             )
 
+        if password_needs_rehash(str(user.password)):
+            if background_tasks is not None:
+                background_tasks.add_task(
+                    self.rehash_password,
+                    user.uuid,
+                    password,
+                    str(user.password),
+                )
+            else:
+                await self.rehash_password(
+                    user.uuid, password, str(user.password)
+                )
+
+        return await self.issue_tokens(user)
+
+    async def issue_tokens(
+        self, user: User | Row, family_id: str | None = None
+    ) -> AccessToken:
         expires_at = datetime.now(timezone.utc) + timedelta(
             minutes=token_expires_in
         )
@@ -55,18 +138,130 @@ class AuthRepository:
             },
         }
 
-        access_token = jwt.encode(payload, SECRET_KEY, ALGORITHM)
+        access_token = key_ring.sign(payload)
+        refresh_token = secrets.token_urlsafe(32)
+        self.db_session.add(
+            RefreshToken(
+                token_hash=token_digest(refresh_token),
+                family_id=family_id or uuid.uuid4().hex,
+                user_id=user.uuid,
+                expires_at=expires_date(
+                    token_expires_in=refresh_token_expires_in
+                ),
+            )
+        )
+        await self.db_session.commit()
         return AccessToken(
             token=access_token,
             token_type='bearer',
             expires_in=token_expires_in,
+            refresh_token=refresh_token,
+        )
+
+    async def refresh(self, refresh_token: str) -> AccessToken:
+        """
+        Exchanges a refresh token for a new access/refresh token pair.
+
+        Every refresh token is single use. Presenting one that was already
+        used means it leaked, so its whole rotation family is revoked.
+        """
+        digest = token_digest(refresh_token)
+        # Claimed in the UPDATE itself, so of two concurrent refreshes
+        # with the same token only one gets a row back.
+        claimed = await self.db_session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == digest,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(used_at=datetime.now(timezone.utc))
+            .returning(
+                RefreshToken.family_id,
+                RefreshToken.user_id,
+                RefreshToken.expires_at,
+            )
+        )
+        stored = claimed.one_or_none()
+        if stored is None:
+            result = await self.db_session.execute(
+                select(
+                    RefreshToken.family_id,
+                    RefreshToken.used_at,
+                    RefreshToken.revoked_at,
+                ).where(RefreshToken.token_hash == digest)
+            )
+            unclaimed = result.one_or_none()
+            # End the write transaction the UPDATE opened before failing.
+            await self.db_session.rollback()
+            if unclaimed is not None and unclaimed.revoked_at is None:
+                await self.revoke_refresh_family(unclaimed.family_id)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail='Invalid refresh token.',
+            )
+        if is_expired(stored.expires_at):
+            await self.db_session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail='The refresh token is expired.',
+            )
+
+        user = await UserRepository(self.db_session).get_user_by_id(
+            user_id=stored.user_id
+        )
+        return await self.issue_tokens(user, family_id=stored.family_id)
+
+    async def revoke_refresh_family(self, family_id: str) -> None:
+        await self.db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id)
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        await self.db_session.commit()
+
+    async def revoke_token(self, token: str) -> None:
+        """
+        Revokes a refresh token (and its rotation family) or an access
+        token. Unknown or already expired tokens are ignored.
+        """
+        stored = await self.db_session.get(RefreshToken, token_digest(token))
+        if stored is not None:
+            await self.revoke_refresh_family(stored.family_id)
+            return
+
+        try:
+            payload = key_ring.decode(token)
+        except JWTError:
+            return
+        await revocation_list.revoke(
+            self.db_session,
+            token,
+            expires_at=datetime.fromtimestamp(payload['exp'], timezone.utc),
+        )
+
+    async def rehash_password(
+        self, user_id: UUID, password: str, verified_hash: str
+    ) -> None:
+        """
+        Moves a verified password onto the current argon2 cost profile,
+        unless it has changed since `verified_hash` was checked: a reset
+        committed in between must not be undone.
+        """
+        await UserRepository(self.db_session).update_password(
+            user_id=user_id,
+            password_hash=await hash_password_async(password),
+            expected_hash=verified_hash,
         )
+        await self.db_session.commit()
 
     async def request_password_recovery_token(
         self, email: str
     ):
         user_result = await self.db_session.execute(
-            select(User).filter(User.email == email)
+            select(User).filter(
+                User.email_normalized == normalize_email(email)
+            )
         )
         user = user_result.scalar_one_or_none()
         if not user:
@@ -83,21 +278,36 @@ class AuthRepository:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="This token is not valid."
                 )
-        if token_on_db.expires_at < datetime.now(timezone.utc):
+        if is_expired(token_on_db.expires_at):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, 
                 detail="The token is expired"
             )
         
-        update_user:User = await UserRepository(self.db_session).get_user_by_id(
-            user_id=token_on_db.user_id
-            )
-        update_user.password = get_password_hash(new_password)
-        
-        self.db_session.add(update_user)
-        await self.db_session.delete(token_on_db)
+        # Hashed before the token is consumed, so the write transaction
+        # isn't held open for the length of an argon2 hash.
+        await release_connection(self.db_session)
+        password_hash = await hash_password_async(new_password)
+        consumed = await self.db_session.execute(
+            delete(ResetPasswordToken)
+            .where(ResetPasswordToken.token == token_on_db.token)
+            .returning(ResetPasswordToken.token)
+        )
+        if not consumed.all():
+            await self.db_session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="This token is not valid."
+                )
+        await UserRepository(self.db_session).update_password(
+            user_id=token_on_db.user_id, password_hash=password_hash
+        )
+        await self.db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == token_on_db.user_id)
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
         await self.db_session.commit()
-        await self.db_session.refresh(update_user)
         
     async def create_token(self, user: User) -> str:
         token = ResetPasswordToken(user_id=user.uuid)
@@ -108,10 +318,20 @@ class AuthRepository:
         return token.token
 
     async def find_token(self, token:str):
+        """
+        The token's row as plain column values, so that concurrent
+        requests presenting the same token can share a single query.
+        """
+        return await reset_token_lookups.do(
+            token, partial(self._select_token, token)
+        )
+
+    async def _select_token(self, token: str):
         result = await self.db_session.execute(
-            select(ResetPasswordToken).filter(
-                ResetPasswordToken.token == token
-            )
+            select(
+                ResetPasswordToken.token,
+                ResetPasswordToken.user_id,
+                ResetPasswordToken.expires_at,
+            ).where(ResetPasswordToken.token == token)
         )
-        token_on_db = result.scalar_one_or_none()
-        return token_on_db
+        return result.one_or_none()
@@ -0,0 +1,142 @@
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.models import RevokedToken
+from app.config.settings import get_config
+from app.system.security.bloom import BloomFilter
+from app.user.utils.calculate_expires_date import is_expired
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RevocationList:
+    """
+    Revoked access tokens, screened by an in-process Bloom filter.
+
+    The filter is topped up at most every `sync_interval` seconds from
+    the rows created since the previous sync, less `sync_overlap`
+    seconds: rows don't commit in the order their ids or timestamps were
+    given out, and one committed late would otherwise never be seen.
+    Once the filter holds more than its capacity, expired rows are
+    deleted and the filter is rebuilt from the rest. Only tokens the
+    filter reports as possibly revoked are looked up in the database,
+    so the common not-revoked case stays in memory.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_interval: float,
+        sync_overlap: float,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.sync_overlap = timedelta(seconds=sync_overlap)
+        self.database_checks = 0
+        self.rebuilds = 0
+        self._filter = BloomFilter(capacity, error_rate)
+        self._synced_at: datetime | None = None
+        self._last_sync: float | None = None
+
+    def add(self, digest: str) -> None:
+        # Overlapping syncs read rows again; count each digest once.
+        if digest.encode() not in self._filter:
+            self._filter.add(digest.encode())
+
+    def reset(self) -> None:
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._synced_at = None
+        self._last_sync = None
+
+    async def sync(self, db_session: AsyncSession) -> None:
+        started = datetime.now(timezone.utc)
+        statement = select(RevokedToken.token_digest, RevokedToken.expires_at)
+        if self._synced_at is not None:
+            statement = statement.where(
+                RevokedToken.created_at >= self._synced_at - self.sync_overlap
+            )
+        result = await db_session.execute(statement)
+        for digest, expires_at in result:
+            if not is_expired(expires_at):
+                self.add(digest)
+        self._synced_at = started
+        self._last_sync = time.monotonic()
+
+        if self._filter.count > self._filter.capacity:
+            await self.rebuild(db_session)
+
+    async def rebuild(self, db_session: AsyncSession) -> None:
+        """
+        Deletes the expired rows and refills the filter from the rest.
+        Should they alone fill it, the filter doubles in size so the
+        next sync doesn't rebuild again.
+        """
+        started = datetime.now(timezone.utc)
+        await db_session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= started)
+        )
+        await db_session.commit()
+        result = await db_session.execute(select(RevokedToken.token_digest))
+        digests = result.scalars().all()
+        self._filter = BloomFilter(
+            max(self.capacity, 2 * len(digests)), self.error_rate
+        )
+        for digest in digests:
+            self.add(digest)
+        self._synced_at = started
+        self.rebuilds += 1
+
+    async def is_revoked(self, db_session: AsyncSession, token: str) -> bool:
+        if (
+            self._last_sync is None
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            await self.sync(db_session)
+
+        digest = token_digest(token)
+        if digest.encode() not in self._filter:
+            return False
+
+        self.database_checks += 1
+        result = await db_session.execute(
+            select(RevokedToken.id).where(RevokedToken.token_digest == digest)
+        )
+        return result.first() is not None
+
+    async def revoke(
+        self, db_session: AsyncSession, token: str, expires_at: datetime
+    ) -> None:
+        digest = token_digest(token)
+        result = await db_session.execute(
+            select(RevokedToken.id).where(RevokedToken.token_digest == digest)
+        )
+        if result.first() is None:
+            db_session.add(
+                RevokedToken(token_digest=digest, expires_at=expires_at)
+            )
+            await db_session.commit()
+        self.add(digest)
+
+    def stats(self) -> dict:
+        return {
+            'filter_size': self._filter.count,
+            'capacity': self.capacity,
+            'database_checks': self.database_checks,
+            'rebuilds': self.rebuilds,
+        }
+
+
+revocation_list = RevocationList(
+    capacity=get_config().REVOCATION_FILTER_CAPACITY,
+    error_rate=get_config().REVOCATION_FILTER_ERROR_RATE,
+    sync_interval=get_config().REVOCATION_SYNC_INTERVAL,
+    sync_overlap=get_config().REVOCATION_SYNC_OVERLAP,
+)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, field_validator
 
 from app.user.utils.validators import validate_email, validate_password
@@ -7,6 +9,15 @@ class AccessToken(BaseModel):
     token: str
     token_type: str = 'bearer'
     expires_in: int
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenSchema(BaseModel):
+    refresh_token: str
+
+
+class RevokeTokenSchema(BaseModel):
+    token: str
 
 
 class ResetPasswordSchema(BaseModel):
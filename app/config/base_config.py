@@ -1,8 +1,18 @@
 import os
 
 
+def _optional(name: str, cast):
+    # Unset means "use the default for the database in DATABASE_URL".
+    value = os.getenv(name)
+    return cast(value) if value else None
+
+
+def _flag(value: str) -> bool:
+    return value.lower() == 'true'
+
+
 class BaseConfig:
-    def __init__(self):
+    def __init__(self):  # noqa: PLR0915
         self.ENVIRONMENT: str = os.getenv('ENVIRONMENT', 'development')
         self.PROJECT_NAME: str = os.getenv('PROJECT_NAME', 'Api Startkit')
         self.SECRET_KEY: str = os.getenv('SECRET_KEY', 'your_secret_key')
@@ -10,3 +20,139 @@ class BaseConfig:
         self.DATABASE_URL: str = os.getenv(
             'DATABASE_URL', 'sqlite:///./test_db.sqlite'
         )
+        self.DATABASE_POOL_SIZE: int | None = _optional(
+            'DATABASE_POOL_SIZE', int
+        )
+        self.DATABASE_MAX_OVERFLOW: int | None = _optional(
+            'DATABASE_MAX_OVERFLOW', int
+        )
+        self.DATABASE_POOL_TIMEOUT: float | None = _optional(
+            'DATABASE_POOL_TIMEOUT', float
+        )
+        self.DATABASE_POOL_RECYCLE: int | None = _optional(
+            'DATABASE_POOL_RECYCLE', int
+        )
+        self.DATABASE_POOL_PRE_PING: bool | None = _optional(
+            'DATABASE_POOL_PRE_PING', _flag
+        )
+        self.DATABASE_STATEMENT_CACHE_SIZE: int | None = _optional(
+            'DATABASE_STATEMENT_CACHE_SIZE', int
+        )
+        self.DATABASE_REPLICA_URLS: str = os.getenv(
+            'DATABASE_REPLICA_URLS', ''
+        )
+        self.DATABASE_REPLICA_POLICY: str = os.getenv(
+            'DATABASE_REPLICA_POLICY', 'round_robin'
+        )
+        self.READ_YOUR_WRITES_WINDOW: float = float(
+            os.getenv('READ_YOUR_WRITES_WINDOW', '5')
+        )
+        self.READ_YOUR_WRITES_MAX_SIZE: int = int(
+            os.getenv('READ_YOUR_WRITES_MAX_SIZE', '10000')
+        )
+        self.SQLITE_PRODUCTION_MODE: bool = _flag(
+            os.getenv('SQLITE_PRODUCTION_MODE', 'false')
+        )
+        self.SQLITE_SYNCHRONOUS: str = os.getenv(
+            'SQLITE_SYNCHRONOUS', 'NORMAL'
+        )
+        # Negative sizes are in KiB, so this is 64 MiB per connection.
+        self.SQLITE_CACHE_SIZE: int = int(
+            os.getenv('SQLITE_CACHE_SIZE', '-65536')
+        )
+        self.SQLITE_MMAP_SIZE: int = int(
+            os.getenv('SQLITE_MMAP_SIZE', '268435456')
+        )
+        self.SQLITE_BUSY_TIMEOUT: int = int(
+            os.getenv('SQLITE_BUSY_TIMEOUT', '5000')
+        )
+        self.DATABASE_WARMUP_CONNECTIONS: int = int(
+            os.getenv('DATABASE_WARMUP_CONNECTIONS', '2')
+        )
+        self.DATABASE_DRAIN_TIMEOUT: float = float(
+            os.getenv('DATABASE_DRAIN_TIMEOUT', '10')
+        )
+        self.PASSWORD_HASH_POOL: str = os.getenv(
+            'PASSWORD_HASH_POOL', 'thread'
+        )
+        self.PASSWORD_HASH_WORKERS: int = int(
+            os.getenv('PASSWORD_HASH_WORKERS', str(os.cpu_count() or 1))
+        )
+        self.PASSWORD_HASH_QUEUE_DEPTH: int = int(
+            os.getenv('PASSWORD_HASH_QUEUE_DEPTH', '64')
+        )
+        self.PASSWORD_HASH_TIME_COST: int = int(
+            os.getenv('PASSWORD_HASH_TIME_COST', '3')
+        )
+        self.PASSWORD_HASH_MEMORY_COST: int = int(
+            os.getenv('PASSWORD_HASH_MEMORY_COST', '65536')
+        )
+        self.PASSWORD_HASH_PARALLELISM: int = int(
+            os.getenv('PASSWORD_HASH_PARALLELISM', '4')
+        )
+        self.JWT_CACHE_MAX_SIZE: int = int(
+            os.getenv('JWT_CACHE_MAX_SIZE', '10000')
+        )
+        self.JWT_PRIVATE_KEYS: str = os.getenv('JWT_PRIVATE_KEYS', '')
+        self.JWT_PUBLIC_KEYS: str = os.getenv('JWT_PUBLIC_KEYS', '')
+        self.JWT_ACTIVE_KID: str = os.getenv('JWT_ACTIVE_KID', '')
+        self.JWKS_CACHE_MAX_AGE: int = int(
+            os.getenv('JWKS_CACHE_MAX_AGE', '86400')
+        )
+        self.REFRESH_TOKEN_EXPIRES: int = int(
+            os.getenv('REFRESH_TOKEN_EXPIRES', str(60 * 24 * 30))
+        )
+        self.REVOCATION_FILTER_CAPACITY: int = int(
+            os.getenv('REVOCATION_FILTER_CAPACITY', '100000')
+        )
+        self.REVOCATION_FILTER_ERROR_RATE: float = float(
+            os.getenv('REVOCATION_FILTER_ERROR_RATE', '0.001')
+        )
+        self.REVOCATION_SYNC_INTERVAL: float = float(
+            os.getenv('REVOCATION_SYNC_INTERVAL', '5')
+        )
+        self.REVOCATION_SYNC_OVERLAP: float = float(
+            os.getenv('REVOCATION_SYNC_OVERLAP', '60')
+        )
+        self.CACHE_BACKEND: str = os.getenv('CACHE_BACKEND', 'memory')
+        # On by default only when shared: with the memory backend every
+        # worker keeps its own copy, which other workers' writes can't
+        # invalidate.
+        self.USER_CACHE_ENABLED: bool = _flag(
+            os.getenv(
+                'USER_CACHE_ENABLED', str(self.CACHE_BACKEND == 'redis')
+            )
+        )
+        self.USER_CACHE_TTL: float = float(os.getenv('USER_CACHE_TTL', '60'))
+        self.USER_CACHE_MAX_SIZE: int = int(
+            os.getenv('USER_CACHE_MAX_SIZE', '10000')
+        )
+        self.CACHE_REDIS_URL: str = os.getenv(
+            'CACHE_REDIS_URL', 'redis://localhost:6379/0'
+        )
+        self.CACHE_LOCAL_TTL: float = float(
+            os.getenv('CACHE_LOCAL_TTL', '5')
+        )
+        self.CACHE_INVALIDATION_CHANNEL: str = os.getenv(
+            'CACHE_INVALIDATION_CHANNEL', 'cache-invalidation'
+        )
+        self.BULK_IMPORT_BATCH_SIZE: int = int(
+            os.getenv('BULK_IMPORT_BATCH_SIZE', '500')
+        )
+        self.BULK_IMPORT_HASH_CONCURRENCY: int = int(
+            os.getenv(
+                'BULK_IMPORT_HASH_CONCURRENCY', str(self.PASSWORD_HASH_WORKERS)
+            )
+        )
+        self.USER_EXPORT_CHUNK_SIZE: int = int(
+            os.getenv('USER_EXPORT_CHUNK_SIZE', '1000')
+        )
+        self.USER_BATCH_MAX_IDS: int = int(
+            os.getenv('USER_BATCH_MAX_IDS', '100')
+        )
+        self.USER_FAST_READ_ENDPOINTS: str = os.getenv(
+            'USER_FAST_READ_ENDPOINTS', ''
+        )
+        self.PRIMARY_KEY_UUID_VERSION: int = int(
+            os.getenv('PRIMARY_KEY_UUID_VERSION', '7')
+        )
@@ -1,6 +1,6 @@
 import os
 
-from .base_config import BaseConfig
+from .base_config import BaseConfig, _flag
 
 
 class TestConfig(BaseConfig):
@@ -12,3 +12,7 @@ class TestConfig(BaseConfig):
         self.AUTH_TOKEN_EXPIRES = os.getenv('AUTH_TOKEN_EXPIRES', '30')
         self.SECRET_KEY = os.getenv('SECRET_KEY', 'test_secret_key')
         self.ALGORITHM = os.getenv('ALGORITHM', 'HS256')
+        # Tests run in one process, where the memory cache is safe.
+        self.USER_CACHE_ENABLED = _flag(
+            os.getenv('USER_CACHE_ENABLED', 'true')
+        )
@@ -1,12 +1,43 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.responses import RedirectResponse
 
 from app.auth.endpoints import router as AuthRouter
+from app.config.settings import get_config
+from app.system.database.connection import read_router
+from app.system.health.endpoints import router as HealthRouter
+from app.system.metrics.endpoints import router as MetricsRouter
+from app.system.responses.json_response import FastJSONResponse
+from app.system.security.security import password_hash_pool
 from app.user.endpoints import router as UserRouter
 
-app = FastAPI()
+DATABASE_WARMUP_CONNECTIONS = get_config().DATABASE_WARMUP_CONNECTIONS
+DATABASE_DRAIN_TIMEOUT = get_config().DATABASE_DRAIN_TIMEOUT
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Built here rather than at import so each forked worker gets its
+    # own connections.
+    for database in read_router.databases:
+        database.start()
+        await database.warm_up(DATABASE_WARMUP_CONNECTIONS)
+    # Only once every pool is warm, so a worker with a primary but no
+    # replicas yet never takes traffic.
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    for database in read_router.databases:
+        await database.dispose(drain_timeout=DATABASE_DRAIN_TIMEOUT)
+    password_hash_pool.shutdown()
+
+
+app = FastAPI(default_response_class=FastJSONResponse, lifespan=lifespan)
 app.include_router(UserRouter)
 app.include_router(AuthRouter)
+app.include_router(MetricsRouter)
+app.include_router(HealthRouter)
 
 
 @app.get('/')
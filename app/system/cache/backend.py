@@ -0,0 +1,29 @@
+from typing import Any
+
+
+class CacheBackend:
+    """
+    Async key/value store behind the application caches. `None` is
+    never stored, so `get` returning `None` always means a miss.
+    """
+
+    async def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    def size(self) -> int | None:  # noqa: PLR6301
+        return None
+
+    async def close(self) -> None:  # noqa: PLR6301
+        return None
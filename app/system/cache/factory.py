@@ -0,0 +1,23 @@
+from app.config.settings import get_config
+from app.system.cache.backend import CacheBackend
+from app.system.cache.memory import MemoryBackend
+from app.system.cache.redis import BroadcastBackend, RedisBackend, RedisClient
+
+
+def build_cache_backend(
+    namespace: str, max_size: int, ttl: float
+) -> CacheBackend:
+    config = get_config()
+    if config.CACHE_BACKEND == 'redis':
+        return BroadcastBackend(
+            local=MemoryBackend(
+                max_size=max_size, ttl=min(ttl, config.CACHE_LOCAL_TTL)
+            ),
+            shared=RedisBackend(
+                RedisClient(config.CACHE_REDIS_URL),
+                ttl=ttl,
+                prefix=f'{namespace}:',
+            ),
+            channel=f'{config.CACHE_INVALIDATION_CHANNEL}:{namespace}',
+        )
+    return MemoryBackend(max_size=max_size, ttl=ttl)
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.system.cache.backend import CacheBackend
+
+
+class TTLCache:
+    """
+    In-process cache with a per-entry TTL and LRU eviction past
+    `max_size` entries. `None` is not a cacheable value.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Per-process backend. Only correct with a single worker, or when
+    something else tells every process about writes.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> Any | None:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        self.cache.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        self.cache.delete(*keys)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+
+    def size(self) -> int | None:
+        return len(self.cache)
@@ -0,0 +1,350 @@
+"""
+Minimal Redis-protocol (RESP2) client and the cache backends built on it.
+
+Only the handful of commands the caches need are used (GET, MGET,
+SET PX, DEL, SCAN, PUBLISH, SUBSCRIBE), so anything speaking RESP works: Redis,
+Valkey, KeyDB, or a local stand-in in tests.
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+from app.system.cache.backend import CacheBackend
+from app.system.cache.memory import MemoryBackend
+
+
+class RedisError(Exception):
+    pass
+
+
+# What an unreachable or misbehaving server raises: refused or dropped
+# connections and timeouts are OSErrors, a reply cut short is an
+# EOFError.
+BACKEND_ERRORS = (OSError, EOFError, RedisError)
+
+
+def _encode_command(*args) -> bytes:
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+    return b''.join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError('Connection closed by server')
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b'+':
+        return body.decode()
+    if prefix == b'-':
+        raise RedisError(body.decode())
+    if prefix == b':':
+        return int(body)
+    if prefix == b'$':
+        length = int(body)
+        if length == -1:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b'*':
+        length = int(body)
+        if length == -1:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise RedisError(f'Unexpected reply: {line!r}')
+
+
+def _default(value):
+    if isinstance(value, uuid.UUID):
+        return {'__uuid__': str(value)}
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f'Cannot cache {type(value).__name__}')
+
+
+def _object_hook(value: dict):
+    if '__uuid__' in value:
+        return uuid.UUID(value['__uuid__'])
+    if '__datetime__' in value:
+        return datetime.fromisoformat(value['__datetime__'])
+    if '__date__' in value:
+        return date.fromisoformat(value['__date__'])
+    return value
+
+
+def dumps(value: Any) -> bytes:
+    return json.dumps(value, default=_default).encode()
+
+
+def loads(data: bytes) -> Any:
+    return json.loads(data, object_hook=_object_hook)
+
+
+class RedisClient:
+    """
+    One pipelined-by-lock connection per event loop, opened lazily.
+    """
+
+    def __init__(self, url: str):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def open_connection(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            writer.write(_encode_command('AUTH', self.password))
+            await _read_reply(reader)
+        if self.db:
+            writer.write(_encode_command('SELECT', self.db))
+            await _read_reply(reader)
+        return reader, writer
+
+    async def execute(self, *args):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reader = self._writer = None
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                self._reader, self._writer = await self.open_connection()
+            try:
+                self._writer.write(_encode_command(*args))
+                await self._writer.drain()
+                return await _read_reply(self._reader)
+            except RedisError:
+                # An error reply was read in full; the stream is intact.
+                raise
+            except BaseException:
+                # Cancelled or failed between sending the command and
+                # reading its reply: the reply may still arrive and
+                # would be taken for the next command's.
+                self._writer.close()
+                self._reader = self._writer = None
+                raise
+
+    async def subscribe(
+        self, channel: str, handler: Callable[[bytes], None]
+    ) -> asyncio.Task:
+        """
+        Subscribes on a dedicated connection and returns the task that
+        feeds `handler` every message. The task ends when the
+        connection is lost.
+        """
+        reader, writer = await self.open_connection()
+        writer.write(_encode_command('SUBSCRIBE', channel))
+        await _read_reply(reader)
+
+        async def listen():
+            try:
+                while True:
+                    kind, _, data = await _read_reply(reader)
+                    if kind == b'message':
+                        handler(data)
+            finally:
+                writer.close()
+
+        return asyncio.create_task(listen())
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class RedisBackend(CacheBackend):
+    def __init__(self, client: RedisClient, ttl: float, prefix: str):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        data = await self.client.execute('GET', self.prefix + key)
+        return None if data is None else loads(data)
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        if not keys:
+            return []
+        values = await self.client.execute(
+            'MGET', *(self.prefix + key for key in keys)
+        )
+        return [None if data is None else loads(data) for data in values]
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        ttl_ms = int((self.ttl if ttl is None else ttl) * 1000)
+        await self.client.execute(
+            'SET', self.prefix + key, dumps(value), 'PX', ttl_ms
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.execute(
+                'DEL', *(self.prefix + key for key in keys)
+            )
+
+    async def clear(self) -> None:
+        cursor = b'0'
+        while True:
+            cursor, keys = await self.client.execute(
+                'SCAN', cursor, 'MATCH', f'{self.prefix}*', 'COUNT', 500
+            )
+            if keys:
+                await self.client.execute('DEL', *keys)
+            if cursor == b'0':
+                break
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class BroadcastBackend(CacheBackend):
+    """
+    Per-process memory cache in front of a shared Redis backend.
+
+    Every write goes to the shared store and is then announced on a
+    pub/sub channel, and every process drops the announced keys from
+    its local copy as soon as the message arrives. Reads only use the
+    local copy while the subscription is up; if it drops, the local
+    copy is cleared and rebuilt from the shared store after
+    resubscribing. The short local TTL bounds staleness should a
+    message be lost anyway.
+
+    The cache never fails a request: while Redis can't be reached,
+    reads are misses, so callers load from the database, and writes
+    only drop the local copy.
+    """
+
+    def __init__(
+        self,
+        local: MemoryBackend,
+        shared: RedisBackend,
+        channel: str,
+    ):
+        self.local = local
+        self.shared = shared
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self.invalidations_received = 0
+        self.backend_errors = 0
+        self._listener: asyncio.Task | None = None
+
+    def _on_message(self, data: bytes) -> None:
+        message = json.loads(data)
+        if message['origin'] == self.origin:
+            return
+        self.invalidations_received += 1
+        if message['keys'] == '*':
+            self.local.cache.clear()
+        else:
+            self.local.cache.delete(*message['keys'])
+
+    async def _ensure_subscribed(self) -> bool:
+        if self._listener is not None and not self._listener.done():
+            return True
+        self.local.cache.clear()
+        try:
+            self._listener = await self.shared.client.subscribe(
+                self.channel, self._on_message
+            )
+        except OSError:
+            self._listener = None
+            return False
+        return True
+
+    async def _publish(self, keys: list[str] | str) -> None:
+        await self.shared.client.execute(
+            'PUBLISH',
+            self.channel,
+            json.dumps({'origin': self.origin, 'keys': keys}),
+        )
+
+    def _backend_error(self) -> None:
+        self.backend_errors += 1
+        # Nothing tells this process what changed while Redis was
+        # away, so its local copy can't be trusted either.
+        self.local.cache.clear()
+
+    async def get(self, key: str) -> Any | None:
+        subscribed = await self._ensure_subscribed()
+        if subscribed:
+            value = await self.local.get(key)
+            if value is not None:
+                return value
+        try:
+            value = await self.shared.get(key)
+        except BACKEND_ERRORS:
+            self._backend_error()
+            return None
+        if value is not None and subscribed:
+            await self.local.set(key, value)
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        subscribed = await self._ensure_subscribed()
+        values = [None] * len(keys)
+        if subscribed:
+            values = await self.local.get_many(keys)
+        missing = [key for key, value in zip(keys, values) if value is None]
+        if not missing:
+            return values
+
+        try:
+            shared = dict(zip(missing, await self.shared.get_many(missing)))
+        except BACKEND_ERRORS:
+            self._backend_error()
+            return [None] * len(keys)
+        for key, value in shared.items():
+            if value is not None and subscribed:
+                await self.local.set(key, value)
+        return [
+            shared.get(key) if value is None else value
+            for key, value in zip(keys, values)
+        ]
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        try:
+            await self.shared.set(key, value, ttl)
+            await self.local.set(key, value)
+            await self._publish([key])
+        except BACKEND_ERRORS:
+            self._backend_error()
+
+    async def delete(self, *keys: str) -> None:
+        await self.local.delete(*keys)
+        try:
+            await self.shared.delete(*keys)
+            await self._publish(list(keys))
+        except BACKEND_ERRORS:
+            self._backend_error()
+
+    async def clear(self) -> None:
+        await self.local.clear()
+        try:
+            await self.shared.clear()
+            await self._publish('*')
+        except BACKEND_ERRORS:
+            self._backend_error()
+
+    def size(self) -> int | None:
+        return self.local.size()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self.shared.close()
@@ -1,42 +1,229 @@
+import asyncio
+import time
+from contextlib import AsyncExitStack
+
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.config.settings import get_config
+from app.system.cache.factory import build_cache_backend
+from app.system.database.lazy_session import HoldStats, LazySession
+from app.system.database.pool import PoolStats, engine_options
+from app.system.database.replicas import ReadRouter
+from app.system.database.sqlite import (
+    BASE_PRAGMAS,
+    WRITER_POOL,
+    is_sqlite_file,
+    pragma_listener,
+    production_pragmas,
+)
+from app.system.metrics.registry import register
 
 load_dotenv()
 
-DATABASE_URL = get_config().DATABASE_URL
 
-if DATABASE_URL and DATABASE_URL.startswith('postgresql://'):
-    DATABASE_URL = DATABASE_URL.replace(
-        'postgresql://', 'postgresql+asyncpg://'
-    )
+def async_url(url: str) -> str:
+    if url and url.startswith('postgresql://'):
+        return url.replace('postgresql://', 'postgresql+asyncpg://')
+    if url and url.startswith('sqlite:///'):
+        return url.replace('sqlite:///', 'sqlite+aiosqlite:///')
+    return url
+
+
+DATABASE_URL = async_url(get_config().DATABASE_URL)
+DATABASE_REPLICA_URLS = [
+    async_url(url.strip())
+    for url in get_config().DATABASE_REPLICA_URLS.split(',')
+    if url.strip()
+]
+
+# Statements run on every connection opened by warm_up, as
+# (statement, parameters), so the first requests find them compiled.
+_warmup_statements: list[tuple] = []
+
+
+def warm_up_statement(statement, parameters: dict) -> None:
+    _warmup_statements.append((statement, parameters))
+
+
+class Database:
+    """
+    Owns the engine and its session factory.
+
+    Nothing is built at import time. The application lifespan starts
+    the engine in each worker process, after any fork, warms the pool
+    before serving and disposes of it on shutdown; scripts and tests
+    that never run the lifespan get the engine on first use instead.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        pool: dict | None = None,
+        pragmas: tuple[str, ...] = BASE_PRAGMAS,
+    ):
+        self.url = url
+        # Pool arguments that win over the DATABASE_POOL_* settings.
+        self.pool = pool or {}
+        # Run on each new connection when the database is SQLite.
+        self.pragmas = pragmas
+        self.pool_stats = PoolStats()
+        self.ready = False
+        self._engine: AsyncEngine | None = None
+        self._session_factory: sessionmaker | None = None
 
-elif DATABASE_URL and DATABASE_URL.startswith('sqlite:///'):
-    DATABASE_URL = DATABASE_URL.replace('sqlite:///', 'sqlite+aiosqlite:///')
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self.start()
+        return self._engine
 
-engine = create_async_engine(
-    DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=30,
-    pool_pre_ping=True,
+    def start(self) -> None:
+        if self._engine is not None:
+            return
+        options = engine_options(self.url, get_config(), self.pool_stats)
+        if 'poolclass' in options:
+            options.update(self.pool)
+        engine = create_async_engine(self.url, **options)
+        if engine.dialect.name == 'sqlite':
+            event.listen(
+                engine.sync_engine, 'connect', pragma_listener(self.pragmas)
+            )
+        self._engine = engine
+        self._session_factory = sessionmaker(
+            bind=engine,
+            autocommit=False,
+            autoflush=False,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+    def session(self) -> AsyncSession:
+        if self._session_factory is None:
+            self.start()
+        return self._session_factory()
+
+    @property
+    def checked_out(self) -> int:
+        if self._engine is None or not isinstance(
+            self._engine.pool, QueuePool
+        ):
+            return 0
+        return self._engine.pool.checkedout()
+
+    async def warm_up(self, connections: int) -> None:
+        """
+        Opens up to `connections` pooled connections at once and runs
+        the registered statements on each, then marks the database
+        ready.
+        """
+        pool = self.engine.pool
+        # Asking for more connections than the pool keeps would only
+        # wait for it to time out.
+        connections = (
+            min(connections, pool.size()) if isinstance(pool, QueuePool) else 1
+        )
+        async with AsyncExitStack() as stack:
+            for _ in range(connections):
+                connection = await stack.enter_async_context(
+                    self.engine.connect()
+                )
+                for statement, parameters in _warmup_statements:
+                    await connection.execute(statement, parameters)
+        self.ready = True
+
+    async def dispose(self, drain_timeout: float = 0) -> None:
+        """
+        Stops reporting ready, waits up to `drain_timeout` seconds for
+        checked-out connections to come back and closes the pool.
+        """
+        self.ready = False
+        if self._engine is None:
+            return
+        pool = self._engine.pool
+        deadline = time.monotonic() + drain_timeout
+        while (
+            isinstance(pool, QueuePool)
+            and pool.checkedout()
+            and time.monotonic() < deadline
+        ):
+            await asyncio.sleep(0.05)
+        await self._engine.dispose()
+        self._engine = None
+        self._session_factory = None
+
+    def stats(self) -> dict:
+        pool = self._engine.pool if self._engine is not None else None
+        return {'ready': self.ready, **self.pool_stats.stats(pool)}
+
+
+# SQLITE_PRODUCTION_MODE puts a SQLite file in WAL mode and splits it
+# in two: every write goes through the primary's single connection,
+# while read-only sessions spread over a pool of query-only connections
+# to the same file. Those see each commit at once, unlike a replica.
+SQLITE_PRODUCTION_MODE = get_config().SQLITE_PRODUCTION_MODE and (
+    is_sqlite_file(DATABASE_URL)
+)
+
+if SQLITE_PRODUCTION_MODE:
+    _pragmas = production_pragmas(get_config())
+    database = Database(DATABASE_URL, pool=WRITER_POOL, pragmas=_pragmas)
+    _readers = [
+        Database(DATABASE_URL, pragmas=(*_pragmas, 'PRAGMA query_only=ON'))
+    ]
+else:
+    database = Database(DATABASE_URL)
+    _readers = [Database(url) for url in DATABASE_REPLICA_URLS]
+register('database_pool', database.stats)
+
+read_router = ReadRouter(
+    primary=database,
+    replicas=_readers,
+    policy=get_config().DATABASE_REPLICA_POLICY,
+    recent_writes=build_cache_backend(
+        namespace='recent_writes',
+        max_size=get_config().READ_YOUR_WRITES_MAX_SIZE,
+        ttl=get_config().READ_YOUR_WRITES_WINDOW,
+    ),
+    read_your_writes=not SQLITE_PRODUCTION_MODE,
 )
+register('database_replicas', read_router.stats)
 
 
-Session = sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    class_=AsyncSession,
-    expire_on_commit=False,
+primary_holds = HoldStats()
+read_holds = HoldStats()
+register(
+    'database_sessions',
+    lambda: {'primary': primary_holds.stats(), 'read': read_holds.stats()},
 )
 
 
 async def get_db():
-    async with Session() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+    """
+    The request's session, built on first use; see LazySession.
+    """
+    session = LazySession(database.session, primary_holds)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_read_db():
+    """
+    Session for read-only endpoints, on a replica when any are
+    configured. Repositories given one still read a user they've just
+    written from the primary.
+    """
+    session = LazySession(read_router.session, read_holds)
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+import uuid
+
+from app.config.settings import get_config
+
+PRIMARY_KEY_UUID_VERSION = get_config().PRIMARY_KEY_UUID_VERSION
+
+COUNTER_MAX = 0xFFF
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_last_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit Unix timestamp in
+    milliseconds, a 12-bit counter and 62 random bits.
+
+    The counter starts at a random value each millisecond and is bumped
+    for ids generated within the same one, so ids from this process are
+    strictly increasing even when the clock stalls or steps back.
+    """
+    global _last_timestamp, _last_counter  # noqa: PLW0603
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            # Leave the top bit clear so the counter has room to grow.
+            counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            timestamp = _last_timestamp
+            counter = _last_counter + 1
+            if counter > COUNTER_MAX:
+                timestamp += 1
+                counter = 0
+        _last_timestamp, _last_counter = timestamp, counter
+
+    random_bits = int.from_bytes(os.urandom(8)) & (1 << 62) - 1
+    return uuid.UUID(
+        int=timestamp << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits
+    )
+
+
+def new_uuid() -> uuid.UUID:
+    """
+    Primary key for a new row: version 7 by default, or random version
+    4 ids with PRIMARY_KEY_UUID_VERSION=4.
+    """
+    if PRIMARY_KEY_UUID_VERSION == 7:  # noqa: PLR2004
+        return uuid7()
+    return uuid.uuid4()
+
+
+def new_token() -> str:
+    return str(new_uuid())
@@ -0,0 +1,128 @@
+import time
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class HoldStats:
+    """
+    How long requests kept a pooled connection checked out. A hold runs
+    from the start of a session transaction, when the connection is
+    taken from the pool, to its commit, rollback or close.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.requests_without_connection = 0
+        self.holds = 0
+        self.held_total = 0.0
+        self.held_max = 0.0
+        self.request_held_max = 0.0
+
+    def record_hold(self, held: float) -> None:
+        self.holds += 1
+        self.held_total += held
+        self.held_max = max(self.held_max, held)
+
+    def record_request(self, held: float, holds: int) -> None:
+        self.requests += 1
+        if not holds:
+            self.requests_without_connection += 1
+        self.request_held_max = max(self.request_held_max, held)
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'requests_without_connection': self.requests_without_connection,
+            'holds': self.holds,
+            'held_avg_ms': round(
+                self.held_total / self.holds * 1000 if self.holds else 0.0,
+                3,
+            ),
+            'held_max_ms': round(self.held_max * 1000, 3),
+            'request_held_avg_ms': round(
+                self.held_total / self.requests * 1000
+                if self.requests
+                else 0.0,
+                3,
+            ),
+            'request_held_max_ms': round(self.request_held_max * 1000, 3),
+        }
+
+
+class LazySession:
+    """
+    Stands in for the `AsyncSession` of one request.
+
+    The session is only built when something first uses it, so requests
+    answered from a cache, or turned away by validation or
+    authentication, never touch the session factory. Attribute access
+    is passed through to the real session, which in turn only checks a
+    connection out when a transaction starts; the time each connection
+    stays out is added up for the request and reported on close.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession], stats: HoldStats):
+        self._factory = factory
+        self._stats = stats
+        self._session: AsyncSession | None = None
+        self._held_since: float | None = None
+        self.held = 0.0
+        self.holds = 0
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None
+
+    def _open(self) -> AsyncSession:
+        if self._session is None:
+            session = self._factory()
+            event.listen(session.sync_session, 'after_begin', self._on_begin)
+            event.listen(
+                session.sync_session,
+                'after_transaction_end',
+                self._on_transaction_end,
+            )
+            self._session = session
+        return self._session
+
+    def _on_begin(self, session, transaction, connection) -> None:
+        if self._held_since is None:
+            self._held_since = time.perf_counter()
+
+    def _on_transaction_end(self, session, transaction) -> None:
+        if transaction.parent is not None or self._held_since is None:
+            return
+        held = time.perf_counter() - self._held_since
+        self._held_since = None
+        self.held += held
+        self.holds += 1
+        self._stats.record_hold(held)
+
+    def __getattr__(self, name: str):
+        return getattr(self._open(), name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+        self._stats.record_request(self.held, self.holds)
+
+
+async def release_connection(session: AsyncSession | LazySession) -> None:
+    """
+    Ends a transaction that has only read, so its connection goes back
+    to the pool while the request carries on. The session stays usable
+    and starts a new transaction if it's needed again. Objects already
+    loaded are kept, as sessions don't expire them on commit.
+
+    Only call this where nothing has been written in the current
+    transaction; pending changes are left alone.
+    """
+    if isinstance(session, LazySession) and not session.started:
+        return
+    if not session.in_transaction():
+        return
+    if session.new or session.dirty or session.deleted:
+        return
+    await session.commit()
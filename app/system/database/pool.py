@@ -0,0 +1,143 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Used for whatever the configuration leaves unset. PostgreSQL sits
+# across the network behind proxies that drop idle connections, so its
+# connections are pinged and recycled; a local SQLite file needs
+# neither, and more connections than CPU cores don't help it.
+DIALECT_DEFAULTS = {
+    'postgresql': {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_timeout': 30.0,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'statement_cache_size': 100,
+    },
+    'sqlite': {
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30.0,
+        'pool_recycle': -1,
+        'pool_pre_ping': False,
+        'statement_cache_size': 128,
+    },
+}
+
+# Driver argument behind each dialect's prepared statement cache.
+STATEMENT_CACHE_ARGUMENTS = {
+    'postgresql': 'prepared_statement_cache_size',
+    'sqlite': 'cached_statements',
+}
+
+
+class PoolStats:
+    """
+    Checkout counters for one engine's pool. Wait time covers queueing
+    for a free connection and opening a new one when the pool grows.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    def stats(self, pool) -> dict:
+        stats = {
+            'checkouts': self.checkouts,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'wait_avg_ms': round(
+                self.wait_total / self.checkouts * 1000
+                if self.checkouts
+                else 0.0,
+                3,
+            ),
+            'wait_max_ms': round(self.wait_max * 1000, 3),
+        }
+        # Only queue pools have a size; the in-memory SQLite pool holds
+        # a single connection.
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return stats
+
+
+def instrumented_pool_class(stats: PoolStats) -> type:
+    """
+    AsyncAdaptedQueuePool subclass recording into `stats`. The stats
+    live on the class because the engine rebuilds its pool from the
+    class alone when it is disposed.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = AsyncAdaptedQueuePool._do_get(self)
+        except exc.TimeoutError:
+            stats.timeouts += 1
+            stats.failures += 1
+            raise
+        except Exception:
+            stats.failures += 1
+            raise
+        stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    return type(
+        'InstrumentedQueuePool', (AsyncAdaptedQueuePool,), {'_do_get': _do_get}
+    )
+
+
+def engine_options(url: str, config, stats: PoolStats) -> dict:
+    """
+    create_async_engine arguments for `url`: the DATABASE_POOL_* and
+    DATABASE_STATEMENT_CACHE_SIZE settings over the dialect's defaults.
+    """
+    parsed = make_url(url)
+    dialect = parsed.get_backend_name()
+    defaults = DIALECT_DEFAULTS.get(dialect, DIALECT_DEFAULTS['postgresql'])
+
+    def setting(name: str, key: str):
+        value = getattr(config, name)
+        return defaults[key] if value is None else value
+
+    options = {
+        'pool_pre_ping': setting('DATABASE_POOL_PRE_PING', 'pool_pre_ping'),
+        'connect_args': {},
+    }
+    statement_cache_size = setting(
+        'DATABASE_STATEMENT_CACHE_SIZE', 'statement_cache_size'
+    )
+    if dialect in STATEMENT_CACHE_ARGUMENTS:
+        options['connect_args'][STATEMENT_CACHE_ARGUMENTS[dialect]] = (
+            statement_cache_size
+        )
+
+    if dialect == 'sqlite' and parsed.database in {None, '', ':memory:'}:
+        # An in-memory database lives and dies with its one connection,
+        # so it keeps SQLAlchemy's single-connection pool.
+        return options
+
+    options.update(
+        poolclass=instrumented_pool_class(stats),
+        pool_size=setting('DATABASE_POOL_SIZE', 'pool_size'),
+        max_overflow=setting('DATABASE_MAX_OVERFLOW', 'max_overflow'),
+        pool_timeout=setting('DATABASE_POOL_TIMEOUT', 'pool_timeout'),
+        pool_recycle=setting('DATABASE_POOL_RECYCLE', 'pool_recycle'),
+    )
+    return options
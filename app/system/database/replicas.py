@@ -0,0 +1,82 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.system.cache.backend import CacheBackend
+
+POLICIES = ('round_robin', 'least_connections')
+
+
+class ReadRouter:
+    """
+    Chooses the database for read-only work.
+
+    Reads are spread over the replicas, in turn or to the one with the
+    fewest checked-out connections, and go to the primary when there
+    are none. Writes are noted per user in `recent_writes`, whose TTL
+    is the read-your-writes window: while a user's entry lives, reads
+    of that user go to the primary so a lagging replica can't undo
+    their own update. With the Redis cache backend the window holds
+    across workers. Replicas that never lag, like SQLite's readers on
+    the primary's own file, can go without it (`read_your_writes`).
+    """
+
+    def __init__(
+        self,
+        primary,
+        replicas: list,
+        policy: str,
+        recent_writes: CacheBackend,
+        read_your_writes: bool = True,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f'Unknown replica policy {policy!r}.')
+        self.primary = primary
+        self.replicas = replicas
+        self.policy = policy
+        self.recent_writes = recent_writes
+        self.read_your_writes = read_your_writes
+        self.replica_sessions = 0
+        self.primary_reads = 0
+        self._next = 0
+
+    @property
+    def databases(self) -> list:
+        return [self.primary, *self.replicas]
+
+    def pick(self):
+        if not self.replicas:
+            return self.primary
+        self.replica_sessions += 1
+        if self.policy == 'least_connections':
+            return min(self.replicas, key=lambda replica: replica.checked_out)
+        replica = self.replicas[self._next % len(self.replicas)]
+        self._next += 1
+        return replica
+
+    def session(self) -> AsyncSession:
+        return self.pick().session()
+
+    @staticmethod
+    def _key(user_id: UUID | str) -> str:
+        return f'wrote:{user_id}'
+
+    async def note_write(self, user_id: UUID | str) -> None:
+        if self.replicas and self.read_your_writes:
+            await self.recent_writes.set(self._key(user_id), True)
+
+    async def wrote_recently(self, user_id: UUID | str) -> bool:
+        if not self.replicas or not self.read_your_writes:
+            return False
+        if await self.recent_writes.get(self._key(user_id)) is None:
+            return False
+        self.primary_reads += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            'policy': self.policy,
+            'replica_sessions': self.replica_sessions,
+            'read_your_writes_primary_reads': self.primary_reads,
+            'replicas': [replica.stats() for replica in self.replicas],
+        }
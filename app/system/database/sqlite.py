@@ -0,0 +1,46 @@
+from sqlalchemy.engine import make_url
+
+# The writer's pool: one connection, so writes wait their turn in the
+# pool's queue instead of racing for SQLite's write lock and failing
+# with "database is locked".
+WRITER_POOL = {'pool_size': 1, 'max_overflow': 0}
+
+# Bulk DELETE statements rely on ON DELETE CASCADE, which SQLite only
+# enforces when asked to.
+BASE_PRAGMAS = ('PRAGMA foreign_keys=ON',)
+
+
+def is_sqlite_file(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == 'sqlite' and parsed.database not in {
+        None,
+        '',
+        ':memory:',
+    }
+
+
+def production_pragmas(config) -> tuple[str, ...]:
+    """
+    Run on every new connection in SQLITE_PRODUCTION_MODE. WAL lets
+    readers carry on while a write is in progress, and with it
+    synchronous=NORMAL only syncs at checkpoints. busy_timeout makes a
+    connection wait that many milliseconds for a lock before giving up.
+    """
+    return (
+        *BASE_PRAGMAS,
+        'PRAGMA journal_mode=WAL',
+        f'PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}',
+        f'PRAGMA cache_size={int(config.SQLITE_CACHE_SIZE)}',
+        f'PRAGMA mmap_size={int(config.SQLITE_MMAP_SIZE)}',
+        f'PRAGMA busy_timeout={int(config.SQLITE_BUSY_TIMEOUT)}',
+    )
+
+
+def pragma_listener(pragmas: tuple[str, ...]):
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return set_pragmas
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Request, status
+
+from app.system.responses.json_response import FastJSONResponse
+
+router = APIRouter(tags=['Health'])
+
+
+@router.get(
+    '/health/ready',
+    summary='Whether this worker should receive traffic',
+    description="""
+            503 until every database pool has been warmed up at
+            startup, and again once shutdown has begun.
+            """,
+)
+async def ready(request: Request):
+    if not getattr(request.app.state, 'ready', False):
+        return FastJSONResponse(
+            {'status': 'starting'},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return {'status': 'ready'}
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+
+from app.system.metrics.registry import collect
+
+router = APIRouter(tags=['Metrics'])
+
+
+@router.get(
+    '/metrics',
+    summary='In-process cache and pool counters',
+    description="""
+            Counters are per worker process and reset on restart.
+            """,
+)
+async def metrics():
+    return collect()
@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core.
+
+    Models, UUIDs and dates are serialized natively instead of going
+    through jsonable_encoder and json.dumps, and bytes are sent as they
+    are, for bodies serialized ahead of time. Returning one from an
+    endpoint also skips FastAPI's validation against response_model,
+    so pass it a model that is already of the documented type.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: PLR6301
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
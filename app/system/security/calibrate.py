@@ -0,0 +1,74 @@
+"""
+Pick argon2 parameters that cost roughly `--target-ms` per hash here.
+
+    python -m app.system.security.calibrate --target-ms 250
+
+Memory cost and parallelism are kept at the requested values and the
+time cost is raised until a hash takes at least the target. When even a
+single pass is too slow, memory cost is halved (down to 8 MiB) instead.
+The result is printed as environment variables for the deployment.
+"""
+
+import argparse
+import statistics
+import time
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.config.settings import get_config
+
+MIN_MEMORY_COST = 8 * 1024
+MAX_TIME_COST = 64
+
+
+def measure_ms(
+    time_cost: int, memory_cost: int, parallelism: int, samples: int
+) -> float:
+    hasher = Argon2Hasher(
+        time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+    )
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash('calibration-password!')
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(
+    target_ms: float, memory_cost: int, parallelism: int, samples: int = 3
+) -> tuple[int, int, float]:
+    elapsed = measure_ms(1, memory_cost, parallelism, samples)
+    while elapsed > target_ms and memory_cost > MIN_MEMORY_COST:
+        memory_cost = max(MIN_MEMORY_COST, memory_cost // 2)
+        elapsed = measure_ms(1, memory_cost, parallelism, samples)
+
+    time_cost = 1
+    while elapsed < target_ms and time_cost < MAX_TIME_COST:
+        time_cost += 1
+        elapsed = measure_ms(time_cost, memory_cost, parallelism, samples)
+    return time_cost, memory_cost, elapsed
+
+
+if __name__ == '__main__':
+    config = get_config()
+    parser = argparse.ArgumentParser(
+        description='Calibrate argon2 cost parameters for this host.'
+    )
+    parser.add_argument('--target-ms', type=float, default=250)
+    parser.add_argument(
+        '--memory-cost', type=int, default=config.PASSWORD_HASH_MEMORY_COST
+    )
+    parser.add_argument(
+        '--parallelism', type=int, default=config.PASSWORD_HASH_PARALLELISM
+    )
+    parser.add_argument('--samples', type=int, default=3)
+    args = parser.parse_args()
+
+    time_cost, memory_cost, elapsed = calibrate(
+        args.target_ms, args.memory_cost, args.parallelism, args.samples
+    )
+    print(f'# {elapsed:.1f} ms per hash (target {args.target_ms:.0f} ms)')
+    print(f'PASSWORD_HASH_TIME_COST={time_cost}')
+    print(f'PASSWORD_HASH_MEMORY_COST={memory_cost}')
+    print(f'PASSWORD_HASH_PARALLELISM={args.parallelism}')
@@ -0,0 +1,150 @@
+"""
+JWT signing keys.
+
+With an HMAC `ALGORITHM` (the default HS256) tokens are signed with
+`SECRET_KEY` exactly as before. With RS*/ES* every key is parsed once at
+startup into a jose key object indexed by `kid`:
+
+    JWT_PRIVATE_KEYS='2025-06=/keys/2025-06.pem,2025-01=/keys/2025-01.pem'
+    JWT_ACTIVE_KID='2025-06'
+    JWT_PUBLIC_KEYS='2024-07=/keys/2024-07.pub.pem'
+
+The active key signs; every other key only verifies, so a rotation is:
+publish the new key under JWT_PUBLIC_KEYS, wait for JWKS caches to pick
+it up, make it active, and drop the old one once its tokens expired.
+
+    python -m app.system.security.keys --algorithm ES256 > 2025-06.pem
+"""
+
+import argparse
+
+import ecdsa
+import rsa
+from jose import jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import JWTError
+
+from app.config.settings import get_config
+
+SYMMETRIC_ALGORITHMS = {'HS256', 'HS384', 'HS512'}
+ASYMMETRIC_ALGORITHMS = {'RS256', 'RS384', 'RS512', 'ES256', 'ES384', 'ES512'}
+
+
+def _parse_key_files(value: str) -> dict[str, str]:
+    key_files = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        kid, _, path = item.partition('=')
+        key_files[kid.strip()] = path.strip()
+    return key_files
+
+
+def _load_key(path: str, algorithm: str) -> Key:
+    with open(path, encoding='utf-8') as pem_file:
+        return jwk.construct(pem_file.read(), algorithm)
+
+
+class KeyRing:
+    def __init__(
+        self,
+        algorithm: str,
+        secret: str | None = None,
+        private_keys: dict[str, Key] | None = None,
+        public_keys: dict[str, Key] | None = None,
+        active_kid: str | None = None,
+    ):
+        if algorithm not in SYMMETRIC_ALGORITHMS | ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f'Unsupported JWT algorithm: {algorithm}')
+        self.algorithm = algorithm
+        self.secret = secret
+        self.active_kid = active_kid
+        self._private_keys = private_keys or {}
+        self._public_keys = {
+            kid: key.public_key() for kid, key in self._private_keys.items()
+        }
+        self._public_keys.update(public_keys or {})
+
+        if self.is_asymmetric and self.active_kid not in self._private_keys:
+            raise ValueError(
+                f'No private key configured for active kid {active_kid!r}'
+            )
+
+    @classmethod
+    def from_config(cls, config) -> 'KeyRing':
+        algorithm = config.ALGORITHM
+        if algorithm in SYMMETRIC_ALGORITHMS:
+            return cls(algorithm=algorithm, secret=config.SECRET_KEY)
+
+        private_files = _parse_key_files(config.JWT_PRIVATE_KEYS)
+        public_files = _parse_key_files(config.JWT_PUBLIC_KEYS)
+        active_kid = config.JWT_ACTIVE_KID or next(iter(private_files), None)
+        return cls(
+            algorithm=algorithm,
+            private_keys={
+                kid: _load_key(path, algorithm)
+                for kid, path in private_files.items()
+            },
+            public_keys={
+                kid: _load_key(path, algorithm)
+                for kid, path in public_files.items()
+            },
+            active_kid=active_kid,
+        )
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.algorithm in ASYMMETRIC_ALGORITHMS
+
+    def sign(self, payload: dict) -> str:
+        if not self.is_asymmetric:
+            return jwt.encode(payload, self.secret, self.algorithm)
+        return jwt.encode(
+            payload,
+            self._private_keys[self.active_kid],
+            self.algorithm,
+            headers={'kid': self.active_kid},
+        )
+
+    def decode(self, token: str) -> dict:
+        if not self.is_asymmetric:
+            return jwt.decode(token, self.secret, algorithms=[self.algorithm])
+
+        kid = jwt.get_unverified_header(token).get('kid', self.active_kid)
+        key = self._public_keys.get(kid)
+        if key is None:
+            raise JWTError(f'Unknown signing key: {kid}')
+        return jwt.decode(token, key, algorithms=[self.algorithm])
+
+    def jwks(self) -> dict:
+        keys = []
+        for kid, key in self._public_keys.items():
+            keys.append({**key.to_dict(), 'kid': kid, 'use': 'sig'})
+        return {'keys': keys}
+
+
+key_ring = KeyRing.from_config(get_config())
+
+
+def generate_private_key(algorithm: str) -> str:
+    if algorithm.startswith('RS'):
+        _, private_key = rsa.newkeys(2048)
+        return private_key.save_pkcs1().decode()
+
+    curves = {
+        'ES256': ecdsa.NIST256p,
+        'ES384': ecdsa.NIST384p,
+        'ES512': ecdsa.NIST521p,
+    }
+    return ecdsa.SigningKey.generate(curve=curves[algorithm]).to_pem().decode()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generate a JWT signing key as PEM on stdout.'
+    )
+    parser.add_argument(
+        '--algorithm',
+        default='ES256',
+        choices=sorted(ASYMMETRIC_ALGORITHMS),
+    )
+    args = parser.parse_args()
+    print(generate_private_key(args.algorithm), end='')
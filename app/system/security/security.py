@@ -1,6 +1,30 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from fastapi import HTTPException, status
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.config.settings import get_config
+
+PASSWORD_HASH_TIME_COST = get_config().PASSWORD_HASH_TIME_COST
+PASSWORD_HASH_MEMORY_COST = get_config().PASSWORD_HASH_MEMORY_COST
+PASSWORD_HASH_PARALLELISM = get_config().PASSWORD_HASH_PARALLELISM
+PASSWORD_HASH_POOL = get_config().PASSWORD_HASH_POOL
+PASSWORD_HASH_WORKERS = get_config().PASSWORD_HASH_WORKERS
+PASSWORD_HASH_QUEUE_DEPTH = get_config().PASSWORD_HASH_QUEUE_DEPTH
 
-pwd_context = PasswordHash.recommended()
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=PASSWORD_HASH_TIME_COST,
+        memory_cost=PASSWORD_HASH_MEMORY_COST,
+        parallelism=PASSWORD_HASH_PARALLELISM,
+    ),
+))
 
 
 def get_password_hash(password: str) -> str:
@@ -9,3 +33,79 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True when the hash was produced with parameters other than the
+    configured argon2 cost profile.
+    """
+    return pwd_context.current_hasher.check_needs_rehash(hashed_password)
+
+
+class PasswordHashPool:
+    """
+    Runs argon2 work off the event loop in a bounded worker pool.
+
+    At most `workers` jobs run at once and up to `queue_depth` more may
+    wait for a worker; anything beyond that is rejected with a 503 so a
+    login burst can't pile up unbounded latency.
+    """
+
+    def __init__(self, kind: str, workers: int, queue_depth: int):
+        self.kind = kind
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.in_flight = 0
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='password-hash',
+                )
+        return self._executor
+
+    async def run(self, func, *args):
+        # Only the event loop thread touches the counter, so no lock needed.
+        if self.in_flight >= self.workers + self.queue_depth:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail='Too many concurrent password operations.',
+                headers={'Retry-After': '1'},
+            )
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    kind=PASSWORD_HASH_POOL,
+    workers=PASSWORD_HASH_WORKERS,
+    queue_depth=PASSWORD_HASH_QUEUE_DEPTH,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
@@ -0,0 +1,279 @@
+"""
+Streaming bulk import of users from NDJSON or CSV.
+
+Rows are parsed as the upload arrives and imported in batches: each
+batch is validated with `UserCreate`, checked against existing emails,
+hashed concurrently in the password hash pool and written with a single
+multi-row INSERT (COPY through a temporary table on PostgreSQL). Bad
+rows are reported with their line number and never abort the import.
+"""
+
+import asyncio
+import csv
+import json
+from datetime import datetime, time
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import get_config
+from app.system.database.ids import new_uuid
+from app.system.database.lazy_session import release_connection
+from app.system.security.security import hash_password_async
+from app.user.models import User
+from app.user.schema import BulkImportResponse, BulkRowError, UserCreate
+from app.user.utils.validators import normalize_email
+
+BULK_IMPORT_BATCH_SIZE = get_config().BULK_IMPORT_BATCH_SIZE
+BULK_IMPORT_HASH_CONCURRENCY = get_config().BULK_IMPORT_HASH_CONCURRENCY
+
+FORMATS = {
+    'application/x-ndjson': 'ndjson',
+    'application/ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv',
+}
+COLUMNS = (
+    'uuid',
+    'email',
+    'email_normalized',
+    'social_name',
+    'first_name',
+    'last_name',
+    'date_of_birth',
+    'password',
+)
+
+# (line number, parsed row or None, parse error or None)
+Record = tuple[int, dict | None, str | None]
+
+
+def format_for_content_type(content_type: str | None) -> str:
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    if media_type not in FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail='Send application/x-ndjson or text/csv.',
+        )
+    return FORMATS[media_type]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    buffer = b''
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            yield line.decode('utf-8-sig').rstrip('\r')
+    if buffer:
+        yield buffer.decode('utf-8-sig').rstrip('\r')
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], format: str
+) -> AsyncIterator[Record]:
+    """
+    Yields every non-blank line as a record. CSV uploads take their
+    field names from the first line; quoted fields can't span lines.
+    """
+    header = None
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if format == 'ndjson':
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, None, f'Invalid JSON: {exc}'
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, 'Expected a JSON object.'
+                continue
+            yield line_number, row, None
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_number, None, (
+                f'Expected {len(header)} fields, got {len(values)}.'
+            )
+            continue
+        yield line_number, {
+            name: value or None for name, value in zip(header, values)
+        }, None
+
+
+def _validation_detail(exc: ValidationError) -> str:
+    return '; '.join(
+        f'{".".join(str(part) for part in error["loc"])}: {error["msg"]}'
+        for error in exc.errors()
+    )
+
+
+class BulkImporter:
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        batch_size: int = BULK_IMPORT_BATCH_SIZE,
+        hash_concurrency: int = BULK_IMPORT_HASH_CONCURRENCY,
+    ):
+        self.db_session = db_session
+        self.batch_size = batch_size
+        # Keeps the import from filling the pool's queue, so logins
+        # arriving meanwhile still get a slot instead of a 503.
+        self._hash_slots = asyncio.Semaphore(hash_concurrency)
+
+    async def run(self, records: AsyncIterator[Record]) -> BulkImportResponse:
+        result = BulkImportResponse()
+        batch = []
+        async for line_number, row, error in records:
+            if error is not None:
+                result.errors.append(
+                    BulkRowError(row=line_number, detail=error)
+                )
+                continue
+            batch.append((line_number, row))
+            if len(batch) >= self.batch_size:
+                await self._import_batch(batch, result)
+                batch = []
+        if batch:
+            await self._import_batch(batch, result)
+
+        result.errors.sort(key=lambda error: error.row)
+        result.failed = len(result.errors)
+        return result
+
+    async def _hash(self, password: str) -> str:
+        async with self._hash_slots:
+            return await hash_password_async(password)
+
+    async def _import_batch(
+        self, batch: list[tuple[int, dict]], result: BulkImportResponse
+    ) -> None:
+        users: dict[str, tuple[int, UserCreate]] = {}
+        for line_number, row in batch:
+            try:
+                user = UserCreate.model_validate(row)
+            except ValidationError as exc:
+                result.errors.append(
+                    BulkRowError(
+                        row=line_number,
+                        email=row.get('email'),
+                        detail=_validation_detail(exc),
+                    )
+                )
+                continue
+            email = normalize_email(user.email)
+            if email in users:
+                result.errors.append(
+                    BulkRowError(
+                        row=line_number,
+                        email=user.email,
+                        detail='Duplicate email in upload.',
+                    )
+                )
+                continue
+            users[email] = (line_number, user)
+
+        if not users:
+            return
+
+        # Dropping known emails before hashing saves the argon2 work on
+        # re-runs; the insert still skips any that appear meanwhile.
+        existing = await self.db_session.execute(
+            select(User.email_normalized).where(
+                User.email_normalized.in_(users)
+            )
+        )
+        for email in existing.scalars():
+            line_number, user = users.pop(email)
+            result.errors.append(
+                BulkRowError(
+                    row=line_number,
+                    email=user.email,
+                    detail='Email already registered.',
+                )
+            )
+        if not users:
+            return
+        # Don't keep the connection out while the batch is hashed.
+        await release_connection(self.db_session)
+
+        hashes = await asyncio.gather(
+            *(self._hash(user.password) for _, user in users.values())
+        )
+        rows = [
+            {
+                **user.model_dump(),
+                'uuid': new_uuid(),
+                'email_normalized': email,
+                'date_of_birth': datetime.combine(
+                    user.date_of_birth, time.min
+                ),
+                'password': password_hash,
+            }
+            for (email, (_, user)), password_hash in zip(
+                users.items(), hashes
+            )
+        ]
+
+        if self.db_session.bind.dialect.name == 'postgresql':
+            inserted = await self._copy_rows(rows)
+        else:
+            inserted = await self._insert_rows(rows)
+        await self.db_session.commit()
+
+        result.created += len(inserted)
+        for email in users.keys() - inserted:
+            line_number, user = users[email]
+            result.errors.append(
+                BulkRowError(
+                    row=line_number,
+                    email=user.email,
+                    detail='Email already registered.',
+                )
+            )
+
+    async def _insert_rows(self, rows: list[dict]) -> set[str]:
+        result = await self.db_session.execute(
+            sqlite_insert(User)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(User.email_normalized)
+        )
+        return set(result.scalars())
+
+    async def _copy_rows(self, rows: list[dict]) -> set[str]:
+        # Begins the transaction, so the COPY and the INSERT below run
+        # in it on the same connection.
+        connection = await self.db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        await driver.execute(
+            'CREATE TEMP TABLE IF NOT EXISTS users_import '
+            '(LIKE users INCLUDING DEFAULTS) ON COMMIT DELETE ROWS'
+        )
+        await driver.copy_records_to_table(
+            'users_import',
+            records=[tuple(row[column] for column in COLUMNS) for row in rows],
+            columns=COLUMNS,
+        )
+        columns = ', '.join(COLUMNS)
+        result = await self.db_session.execute(
+            text(
+                f'INSERT INTO users ({columns}) '
+                f'SELECT {columns} FROM users_import '
+                'ON CONFLICT DO NOTHING RETURNING email_normalized'
+            )
+        )
+        return set(result.scalars())
@@ -0,0 +1,165 @@
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from app.config.settings import get_config
+from app.system.cache.backend import CacheBackend
+from app.system.cache.factory import build_cache_backend
+from app.system.cache.single_flight import SingleFlight
+from app.system.metrics.registry import register
+from app.user.models import User
+from app.user.utils.validators import normalize_email
+
+Loader = Callable[[], Awaitable[dict | None]]
+BatchLoader = Callable[[list[UUID]], Awaitable[list[dict]]]
+
+
+def user_snapshot(user: User) -> dict:
+    """
+    Plain column values of a user, minus the password hash, which is
+    what the cache keeps instead of session-bound ORM instances.
+    """
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key != 'password'
+    }
+
+
+class UserCache:
+    """
+    Read-through cache of user snapshots, by id and by email.
+
+    Email entries only point at the id, and are trusted only while the
+    snapshot they lead to still has that email. On a miss only the first
+    caller runs the loader; concurrent callers for the same key await
+    its result instead of issuing the same SELECT. A load that raced
+    with an invalidation is returned but not stored.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.flight = SingleFlight()
+        self._generation = 0
+
+    @property
+    def coalesced(self) -> int:
+        return self.flight.coalesced
+
+    @staticmethod
+    def _id_key(user_id: UUID | str) -> str:
+        return f'user:id:{user_id}'
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f'user:email:{normalize_email(email)}'
+
+    async def _cached_by_email(self, email: str) -> dict | None:
+        user_id = await self.backend.get(self._email_key(email))
+        if user_id is None:
+            return None
+        snapshot = await self.backend.get(self._id_key(user_id))
+        if snapshot is None or (
+            normalize_email(snapshot['email']) != normalize_email(email)
+        ):
+            return None
+        return snapshot
+
+    async def _load(
+        self, key: str, cached: dict | None, loader: Loader
+    ) -> dict | None:
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        return await self.flight.do(key, lambda: self._load_and_store(loader))
+
+    async def _load_and_store(self, loader: Loader) -> dict | None:
+        generation = self._generation
+        snapshot = await loader()
+        if snapshot is not None and generation == self._generation:
+            await self.store(snapshot)
+        return snapshot
+
+    async def get_by_id(self, user_id: UUID, loader: Loader) -> dict | None:
+        key = self._id_key(user_id)
+        return await self._load(key, await self.backend.get(key), loader)
+
+    async def get_by_email(self, email: str, loader: Loader) -> dict | None:
+        return await self._load(
+            self._email_key(email), await self._cached_by_email(email), loader
+        )
+
+    async def get_many(
+        self, user_ids: list[UUID], loader: BatchLoader
+    ) -> dict[UUID, dict]:
+        """
+        Snapshots for every id found, reading the cache first and
+        handing all the misses to one `loader` call.
+        """
+        cached = await self.backend.get_many(
+            [self._id_key(user_id) for user_id in user_ids]
+        )
+        found = {
+            user_id: snapshot
+            for user_id, snapshot in zip(user_ids, cached)
+            if snapshot is not None
+        }
+        missing = [user_id for user_id in user_ids if user_id not in found]
+        self.hits += len(found)
+        self.misses += len(missing)
+        if not missing:
+            return found
+
+        generation = self._generation
+        for snapshot in await loader(missing):
+            found[snapshot['uuid']] = snapshot
+            if generation == self._generation:
+                await self.store(snapshot)
+        return found
+
+    async def store(self, snapshot: dict) -> None:
+        await self.backend.set(self._id_key(snapshot['uuid']), snapshot)
+        await self.backend.set(
+            self._email_key(snapshot['email']), snapshot['uuid']
+        )
+
+    async def invalidate(self, user_id: UUID) -> None:
+        self._generation += 1
+        key = self._id_key(user_id)
+        snapshot = await self.backend.get(key)
+        keys = [key]
+        if snapshot is not None:
+            keys.append(self._email_key(snapshot['email']))
+        await self.backend.delete(*keys)
+
+    async def clear(self) -> None:
+        self._generation += 1
+        await self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'size': self.backend.size(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'coalesced': self.coalesced,
+        }
+
+
+user_cache = (
+    UserCache(
+        build_cache_backend(
+            namespace='user_cache',
+            max_size=get_config().USER_CACHE_MAX_SIZE,
+            ttl=get_config().USER_CACHE_TTL,
+        )
+    )
+    if get_config().USER_CACHE_ENABLED
+    else None
+)
+
+if user_cache is not None:
+    register('user_cache', user_cache.stats)
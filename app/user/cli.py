@@ -0,0 +1,110 @@
+"""
+User administration from the command line.
+
+    python -m app.user.cli import users.ndjson
+    python -m app.user.cli import users.csv --batch-size 1000
+    python -m app.user.cli export --format csv --gzip -o users.csv.gz
+
+The file format follows the extension (.csv or .csv.gz, anything else
+is NDJSON) unless `--format` is given. Imports print a summary as JSON
+and exit with status 1 when any row failed. Exports go to stdout
+without `--output`.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from app.system.database.connection import database
+from app.system.security.security import password_hash_pool
+from app.user.bulk import BULK_IMPORT_BATCH_SIZE, BulkImporter, iter_records
+from app.user.export import (
+    USER_EXPORT_CHUNK_SIZE,
+    cursor_position,
+    export_users,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open('rb') as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def import_users(path: Path, format: str, batch_size: int) -> int:
+    async with database.session() as session:
+        importer = BulkImporter(db_session=session, batch_size=batch_size)
+        result = await importer.run(
+            iter_records(read_chunks(path), format)
+        )
+    await database.dispose()
+    password_hash_pool.shutdown()
+    print(result.model_dump_json(indent=2))
+    return 1 if result.failed else 0
+
+
+async def export_to(output: BinaryIO, **options) -> int:
+    async for chunk in export_users(**options):
+        output.write(chunk)
+    output.flush()
+    await database.dispose()
+    return 0
+
+
+def guess_format(path: Path | None) -> str:
+    suffixes = [suffix.lower() for suffix in path.suffixes] if path else []
+    return 'csv' if '.csv' in suffixes else 'ndjson'
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Manage users.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser(
+        'import', help='Import users from an NDJSON or CSV file.'
+    )
+    import_parser.add_argument('path', type=Path)
+    import_parser.add_argument('--format', choices=('ndjson', 'csv'))
+    import_parser.add_argument(
+        '--batch-size', type=int, default=BULK_IMPORT_BATCH_SIZE
+    )
+
+    export_parser = commands.add_parser(
+        'export', help='Export all users as NDJSON or CSV.'
+    )
+    export_parser.add_argument('-o', '--output', type=Path)
+    export_parser.add_argument('--format', choices=('ndjson', 'csv'))
+    export_parser.add_argument('--gzip', action='store_true')
+    export_parser.add_argument('--cursor')
+    export_parser.add_argument(
+        '--chunk-size', type=int, default=USER_EXPORT_CHUNK_SIZE
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == 'import':
+        return asyncio.run(
+            import_users(
+                args.path,
+                args.format or guess_format(args.path),
+                args.batch_size,
+            )
+        )
+
+    options = {
+        'format': args.format or guess_format(args.output),
+        'after': cursor_position(args.cursor),
+        'chunk_size': args.chunk_size,
+        'gzip': args.gzip,
+    }
+    if args.output is None:
+        return asyncio.run(export_to(sys.stdout.buffer, **options))
+    with args.output.open('wb') as output:
+        return asyncio.run(export_to(output, **options))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
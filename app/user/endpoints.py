@@ -1,15 +1,90 @@
+from typing import Annotated, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.system.database.connection import get_db
+from app.config.settings import get_config
+from app.system.database.connection import (
+    get_db,
+    get_read_db,
+    read_router,
+)
+from app.system.responses.json_response import FastJSONResponse
+from app.user.bulk import (
+    BULK_IMPORT_BATCH_SIZE,
+    BulkImporter,
+    format_for_content_type,
+    iter_records,
+)
+from app.user.export import (
+    MEDIA_TYPES,
+    USER_EXPORT_CHUNK_SIZE,
+    cursor_position,
+    export_users,
+)
 from app.user.repository import UserRepository
-from app.user.schema import BaseUserSchema, UserCreate, UserResponse
+from app.user.schema import (
+    BaseUserSchema,
+    BulkImportResponse,
+    TokenUser,
+    UserBatchRequest,
+    UserBatchResponse,
+    UserCreate,
+    UserListQuery,
+    UserMeResponse,
+    UserPage,
+    UserResponse,
+)
+from app.user.utils.cursor import decode_cursor, encode_cursor
 from app.user.utils.decode_user_token import get_current_user
+from app.user.utils.etag import etag_versions, user_etag
 
 router = APIRouter(prefix='/user', tags=['Users'])
 
+USER_BATCH_MAX_IDS = get_config().USER_BATCH_MAX_IDS
+# Endpoints (by function name) answered through the ORM-free read path.
+FAST_READ_ENDPOINTS = {
+    name.strip()
+    for name in get_config().USER_FAST_READ_ENDPOINTS.split(',')
+    if name.strip()
+}
+
+
+async def _get_user_batch(
+    db_session: AsyncSession, read_session: AsyncSession, user_ids: list[UUID]
+) -> UserBatchResponse:
+    if len(user_ids) > USER_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'At most {USER_BATCH_MAX_IDS} ids per request.',
+        )
+    repository = UserRepository(
+        db_session=db_session, read_session=read_session
+    )
+    users = await repository.get_users_by_ids(user_ids=user_ids)
+    return UserBatchResponse(
+        users={
+            user_id: UserResponse.model_validate(user)
+            for user_id, user in users.items()
+        },
+        missing=[
+            user_id
+            for user_id in dict.fromkeys(user_ids)
+            if user_id not in users
+        ],
+    )
+
 
 @router.post(
     '/',
@@ -27,22 +102,226 @@ async def create_user(
 ):
     repository = UserRepository(db_session=db_session)
     user = await repository.create_user(user_data=user_data)
-    return user
+    return FastJSONResponse(
+        UserResponse.model_validate(user),
+        status_code=status.HTTP_201_CREATED,
+        headers={'ETag': user_etag(user.version)},
+    )
+
+
+@router.get(
+    '/',
+    response_model=UserPage,
+    summary='List and search users.',
+    description="""
+    Users ordered by email, a page at a time. Pass the next_cursor of a
+    page as cursor to get the one after it, with the same filters; it is
+    null on the last page. name matches the start of the first or last
+    name, ignoring case, and the birth-date bounds are inclusive.
+    """,
+)
+async def list_users(
+    query: Annotated[UserListQuery, Query()],
+    read_session: AsyncSession = Depends(get_read_db),
+    current_user: TokenUser = Depends(get_current_user),
+):
+    after = (
+        decode_cursor(query.cursor, 'email')['email'] if query.cursor else None
+    )
+    repository = UserRepository(db_session=read_session)
+    users, has_more = await repository.list_users(
+        filters=query, after=after, limit=query.limit
+    )
+    return FastJSONResponse(
+        UserPage(
+            items=[UserResponse.model_validate(user) for user in users],
+            next_cursor=(
+                encode_cursor({'email': users[-1].email_normalized})
+                if has_more
+                else None
+            ),
+        )
+    )
+
+
+@router.post(
+    '/bulk',
+    response_model=BulkImportResponse,
+    summary='Import users in bulk.',
+    description="""
+    Send one user per line as application/x-ndjson, or text/csv with a
+    header line. Each row is validated like a single user creation;
+    rows that fail, including already registered emails, are listed in
+    the response with their line number and the rest are imported.
+    """,
+)
+async def bulk_import_users(
+    request: Request,
+    batch_size: int = Query(BULK_IMPORT_BATCH_SIZE, ge=1),
+    db_session: AsyncSession = Depends(get_db),
+    current_user: TokenUser = Depends(get_current_user),
+):
+    records = iter_records(
+        request.stream(),
+        format_for_content_type(request.headers.get('content-type')),
+    )
+    importer = BulkImporter(db_session=db_session, batch_size=batch_size)
+    return FastJSONResponse(await importer.run(records))
+
+
+@router.get(
+    '/export',
+    summary='Export all users.',
+    description="""
+    Streams every user, ordered by id, as NDJSON or CSV. gzip=true
+    compresses the stream on the fly. With resumable=true (NDJSON only)
+    a {"cursor": ...} line follows every chunk; pass the last one
+    received as cursor to continue an interrupted export.
+    """,
+)
+async def export_users_endpoint(  # noqa: PLR0913, PLR0917
+    format: Literal['ndjson', 'csv'] = 'ndjson',
+    gzip: bool = False,
+    resumable: bool = False,
+    cursor: Optional[str] = None,
+    chunk_size: int = Query(USER_EXPORT_CHUNK_SIZE, ge=1),
+    current_user: TokenUser = Depends(get_current_user),
+):
+    if resumable and format != 'ndjson':
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Resumable exports are only available as NDJSON.',
+        )
+    body = export_users(
+        format=format,
+        after=cursor_position(cursor),
+        chunk_size=chunk_size,
+        gzip=gzip,
+        resumable=resumable,
+        session_factory=read_router.session,
+    )
+    headers = {
+        'Content-Disposition': f'attachment; filename="users.{format}"'
+    }
+    if gzip:
+        headers['Content-Encoding'] = 'gzip'
+    return StreamingResponse(
+        body, media_type=MEDIA_TYPES[format], headers=headers
+    )
+
+
+@router.get(
+    '/batch',
+    response_model=UserBatchResponse,
+    summary='Retrieve many users by their IDs.',
+    description="""
+    Pass the ids as repeated or comma-separated ids parameters. Found
+    users come back keyed by id and unknown ids are listed in missing.
+    Use the POST variant when the ids don't fit in a URL.
+    """,
+)
+async def get_users_batch(
+    ids: list[str] = Query(),
+    db_session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
+    current_user: TokenUser = Depends(get_current_user),
+):
+    try:
+        user_ids = [
+            UUID(value) for param in ids for value in param.split(',') if value
+        ]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='ids must be UUIDs.',
+        ) from None
+    return FastJSONResponse(
+        await _get_user_batch(db_session, read_session, user_ids)
+    )
+
+
+@router.post(
+    '/batch',
+    response_model=UserBatchResponse,
+    summary='Retrieve many users by their IDs.',
+)
+async def post_users_batch(
+    batch: UserBatchRequest,
+    db_session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
+    current_user: TokenUser = Depends(get_current_user),
+):
+    return FastJSONResponse(
+        await _get_user_batch(db_session, read_session, batch.ids)
+    )
+
+
+@router.get(
+    '/me',
+    response_model=UserMeResponse,
+    summary='Retrieve the authenticated user.',
+    description="""
+    Answered from the access token claims without touching the
+    database. Pass fresh=true to load the full, current record instead.
+    """,
+)
+async def get_me(
+    fresh: bool = False,
+    db_session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
+    current_user: TokenUser = Depends(get_current_user),
+):
+    if not fresh:
+        return FastJSONResponse(
+            UserMeResponse.model_construct(**dict(current_user))
+        )
+    repository = UserRepository(
+        db_session=db_session, read_session=read_session
+    )
+    if 'get_me' in FAST_READ_ENDPOINTS:
+        response, _ = await repository.get_user_response(
+            user_id=current_user.uuid
+        )
+        return FastJSONResponse(response)
+    user = await repository.get_user_by_id(user_id=current_user.uuid)
+    return FastJSONResponse(UserResponse.model_validate(user))
 
 
 @router.get(
     '/{user_id}',
     response_model=UserResponse,
     summary='Retrieve a user by their ID.',
+    description="""
+    The ETag header changes whenever the user is updated. Send it back
+    as If-None-Match to get an empty 304 while the user is unchanged.
+    """,
 )
 async def get_user(
     user_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     db_session: AsyncSession = Depends(get_db),
-    user_uuid_token: dict = Depends(get_current_user),
+    read_session: AsyncSession = Depends(get_read_db),
+    current_user: TokenUser = Depends(get_current_user),
 ):
-    repository = UserRepository(db_session=db_session)
-    user = await repository.get_user_by_id(user_id=user_id)
-    return UserResponse.model_validate(user)
+    repository = UserRepository(
+        db_session=db_session, read_session=read_session
+    )
+    if if_none_match is not None:
+        version = await repository.get_user_version(user_id=user_id)
+        versions = etag_versions(if_none_match, weak=True)
+        if versions is None or version in versions:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={'ETag': user_etag(version)},
+            )
+    if 'get_user' in FAST_READ_ENDPOINTS:
+        response, version = await repository.get_user_response(
+            user_id=user_id
+        )
+    else:
+        user = await repository.get_user_by_id(user_id=user_id)
+        response, version = UserResponse.model_validate(user), user.version
+    return FastJSONResponse(response, headers={'ETag': user_etag(version)})
 
 
 @router.put(
@@ -50,18 +329,30 @@ async def get_user(
     response_model=UserResponse,
     summary="Update an existing user's details.",
     description="""
-            First name and last name must be longer than 3 characters
+            First name and last name must be longer than 3 characters.
+            Send the ETag last read as If-Match to have the update
+            rejected with 412 if the user changed in the meantime.
             """,
 )
 async def update_user(
     user_id: UUID,
     user_data: BaseUserSchema,
+    if_match: Optional[str] = Header(None),
     db_session: AsyncSession = Depends(get_db),
-    user_uuid_token: dict = Depends(get_current_user),
+    current_user: TokenUser = Depends(get_current_user),
 ):
     repository = UserRepository(db_session=db_session)
-    user = await repository.update_user(user_id=user_id, user_data=user_data)
-    return UserResponse.model_validate(user)
+    user = await repository.update_user(
+        user_id=user_id,
+        user_data=user_data,
+        expected_versions=(
+            etag_versions(if_match) if if_match is not None else None
+        ),
+    )
+    return FastJSONResponse(
+        UserResponse.model_validate(user),
+        headers={'ETag': user_etag(user.version)},
+    )
 
 
 @router.delete(
@@ -72,7 +363,7 @@ async def update_user(
 async def delete_user(
     user_id: UUID,
     db_session: AsyncSession = Depends(get_db),
-    user_uuid_token: dict = Depends(get_current_user),
+    current_user: TokenUser = Depends(get_current_user),
 ):
     await UserRepository(db_session=db_session).delete_user(user_id=user_id)
     return Response(
@@ -1,25 +1,38 @@
-import uuid
-
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+from app.system.database.ids import new_token, new_uuid
 from app.user.utils.calculate_expires_date import expires_date
+from app.user.utils.validators import normalize_email
 
 Base = declarative_base()
 
 
+def _email_normalized_default(context) -> str:
+    return normalize_email(context.get_current_parameters()['email'])
+
+
 class User(Base):
     __tablename__ = 'users'
 
-    uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    uuid = Column(UUID(as_uuid=True), primary_key=True, default=new_uuid)
     email = Column(String, unique=True, nullable=False)
+    email_normalized = Column(
+        String,
+        unique=True,
+        index=True,
+        nullable=False,
+        default=_email_normalized_default,
+    )
     social_name = Column(String, nullable=True)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
-    date_of_birth = Column(DateTime, nullable=False)
+    date_of_birth = Column(DateTime, nullable=False, index=True)
     password = Column(String, nullable=False)
+    # Bumped by every profile update; exposed to clients as the ETag.
+    version = Column(Integer, nullable=False, default=1, server_default='1')
 
     reset_tokens = relationship(
         'ResetPasswordToken',
@@ -31,7 +44,7 @@ class User(Base):
 class ResetPasswordToken(Base):
     __tablename__ = 'reset_password_tokens'
 
-    token = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    token = Column(String, primary_key=True, default=new_token)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey('users.uuid', ondelete='CASCADE'),
@@ -1,68 +1,346 @@
+from datetime import datetime, time, timedelta
+from functools import partial
 from uuid import UUID
 
 from dotenv import load_dotenv
 from fastapi import status
 from fastapi.exceptions import HTTPException
+from sqlalchemy import bindparam, delete, func, insert, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.config.settings import get_config
-from app.system.security.security import get_password_hash
+from app.system.cache.single_flight import SingleFlight
+from app.system.database.connection import read_router, warm_up_statement
+from app.system.metrics.registry import register
+from app.system.security.security import hash_password_async
+from app.user.cache import UserCache, user_cache, user_snapshot
 from app.user.models import User
-from app.user.schema import BaseUserSchema, UserCreate
+from app.user.schema import (
+    BaseUserSchema,
+    UserCreate,
+    UserFilter,
+    UserResponse,
+)
+from app.user.utils.validators import normalize_email
 
 load_dotenv()
 token_expires_in = int(get_config().AUTH_TOKEN_EXPIRES)
 ALGORITHM = get_config().ALGORITHM
 SECRET_KEY = get_config().SECRET_KEY
 
+# Coalesces concurrent lookups when the user cache, which does the same
+# for its misses, is disabled.
+user_lookups = SingleFlight()
+register('user_lookups', user_lookups.stats)
+
+# Every users column but the password, i.e. a cache snapshot, selected
+# through Core so no ORM instance is built for a read-only lookup.
+SNAPSHOT_QUERY = select(
+    *(column for column in User.__table__.c if column.key != 'password')
+).where(User.__table__.c.uuid == bindparam('user_id'))
+VERSION_QUERY = select(User.__table__.c.version).where(
+    User.__table__.c.uuid == bindparam('user_id')
+)
+warm_up_statement(SNAPSHOT_QUERY, {'user_id': UUID(int=0)})
+warm_up_statement(VERSION_QUERY, {'user_id': UUID(int=0)})
+
 
 class UserRepository:
-    def __init__(self, db_session: AsyncSession):
+    """
+    Writes go through `db_session`. Lookups use `read_session` when one
+    is given, typically on a replica, except for users written within
+    the read-your-writes window, which are read from `db_session`.
+    Lists and batches are always served by `read_session`.
+    """
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        cache: UserCache | None = user_cache,
+        read_session: AsyncSession | None = None,
+    ):
         self.db_session = db_session
+        self.cache = cache
+        self.read_session = read_session or db_session
+
+    async def _reader(self, user_id: UUID | None = None) -> AsyncSession:
+        if self.read_session is self.db_session:
+            return self.db_session
+        if user_id is not None and await read_router.wrote_recently(user_id):
+            return self.db_session
+        return self.read_session
 
     async def create_user(self, user_data: UserCreate) -> User:
-        user = User(**user_data.model_dump())
-        user.password = get_password_hash(user_data.password)
-        self.db_session.add(user)
-        await self.db_session.flush()
+        values = user_data.model_dump()
+        values['email_normalized'] = normalize_email(user_data.email)
+        values['password'] = await hash_password_async(user_data.password)
+        result = await self.db_session.execute(
+            insert(User).values(**values).returning(User)
+        )
+        user = result.scalar_one()
         await self.db_session.commit()
-        await self.db_session.refresh(user)
+        await read_router.note_write(user.uuid)
+        if self.cache is not None:
+            await self.cache.store(user_snapshot(user))
         return user
 
-    async def get_user_by_id(self, user_id: UUID) -> User:
-        result = await self.db_session.execute(
-            select(User).filter_by(uuid=user_id)
+    @staticmethod
+    async def _load_snapshots(
+        session: AsyncSession, user_ids: list[UUID]
+    ) -> list[dict]:
+        result = await session.execute(
+            select(User).where(User.uuid.in_(user_ids))
         )
+        return [user_snapshot(user) for user in result.scalars()]
+
+    @staticmethod
+    async def _load_snapshot(session: AsyncSession, **filters) -> dict | None:
+        result = await session.execute(select(User).filter_by(**filters))
         user = result.scalar_one_or_none()
+        return user_snapshot(user) if user is not None else None
+
+    async def get_user_by_id(self, user_id: UUID) -> User:
+        loader = partial(
+            self._load_snapshot, await self._reader(user_id), uuid=user_id
+        )
+        if self.cache is None:
+            snapshot = await user_lookups.do(f'id:{user_id}', loader)
+        else:
+            snapshot = await self.cache.get_by_id(user_id, loader)
+        user = User(**snapshot) if snapshot is not None else None
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail='user not found.'
             )
         return user
 
+    @staticmethod
+    async def _fetch_snapshot(
+        session: AsyncSession, user_id: UUID
+    ) -> dict | None:
+        connection = await session.connection()
+        result = await connection.execute(
+            SNAPSHOT_QUERY, {'user_id': user_id}
+        )
+        row = result.one_or_none()
+        return dict(row._mapping) if row is not None else None
+
+    async def get_user_response(
+        self, user_id: UUID
+    ) -> tuple[UserResponse, int]:
+        """
+        Same lookup as get_user_by_id, answered from a Core row or the
+        cached snapshot straight into the response schema. Returns the
+        user's version alongside it.
+        """
+        loader = partial(
+            self._fetch_snapshot, await self._reader(user_id), user_id
+        )
+        if self.cache is None:
+            snapshot = await user_lookups.do(f'id:{user_id}', loader)
+        else:
+            snapshot = await self.cache.get_by_id(user_id, loader)
+        if snapshot is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail='user not found.'
+            )
+        return UserResponse.model_validate(snapshot), snapshot['version']
+
+    @staticmethod
+    async def _select_version(
+        session: AsyncSession, user_id: UUID
+    ) -> int | None:
+        connection = await session.connection()
+        result = await connection.execute(
+            VERSION_QUERY, {'user_id': user_id}
+        )
+        return result.scalar_one_or_none()
+
+    async def get_user_version(self, user_id: UUID) -> int:
+        """
+        Current version of a user, for conditional requests. Read from
+        the cached snapshot when there is a cache, otherwise only the
+        version column is selected.
+        """
+        session = await self._reader(user_id)
+        if self.cache is None:
+            version = await self._select_version(session, user_id)
+        else:
+            snapshot = await self.cache.get_by_id(
+                user_id, partial(self._fetch_snapshot, session, user_id)
+            )
+            version = snapshot['version'] if snapshot is not None else None
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail='user not found.'
+            )
+        return version
+
     async def get_user_by_email(self, email: str) -> User:
-        result = await self.db_session.execute(
-            select(User).filter_by(email=email)
+        email = normalize_email(email)
+        loader = partial(
+            self._load_snapshot,
+            await self._reader(),
+            email_normalized=email,
         )
-        user = result.scalar_one_or_none()
+        if self.cache is None:
+            snapshot = await user_lookups.do(f'email:{email}', loader)
+        else:
+            snapshot = await self.cache.get_by_email(email, loader)
+        user = User(**snapshot) if snapshot is not None else None
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail='user not found.'
             )
         return user
 
+    async def get_users_by_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, User]:
+        """
+        The users among `user_ids` that exist, keyed by id, fetched with
+        a single IN query for whatever the cache can't answer.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        loader = partial(self._load_snapshots, await self._reader())
+        if self.cache is None:
+            snapshots = {
+                snapshot['uuid']: snapshot
+                for snapshot in await loader(user_ids)
+            }
+        else:
+            snapshots = await self.cache.get_many(user_ids, loader)
+        return {key: User(**value) for key, value in snapshots.items()}
+
+    async def list_users(
+        self, filters: UserFilter, after: str | None, limit: int
+    ) -> tuple[list[User], bool]:
+        """
+        One page of users ordered by normalized email, starting after
+        the normalized email `after`. Seeking past the previous page
+        instead of using OFFSET keeps every page as cheap as the first.
+        Also reports whether more users follow.
+        """
+        statement = (
+            select(User).order_by(User.email_normalized).limit(limit + 1)
+        )
+        if after is not None:
+            statement = statement.where(User.email_normalized > after)
+        if filters.email_prefix:
+            statement = statement.where(
+                User.email_normalized.startswith(
+                    normalize_email(filters.email_prefix), autoescape=True
+                )
+            )
+        if filters.name:
+            name = filters.name.lower()
+            statement = statement.where(
+                or_(
+                    func.lower(User.first_name).startswith(
+                        name, autoescape=True
+                    ),
+                    func.lower(User.last_name).startswith(
+                        name, autoescape=True
+                    ),
+                )
+            )
+        if filters.born_from:
+            born_from = datetime.combine(filters.born_from, time.min)
+            statement = statement.where(User.date_of_birth >= born_from)
+        if filters.born_to:
+            born_to = datetime.combine(filters.born_to, time.min)
+            statement = statement.where(
+                User.date_of_birth < born_to + timedelta(days=1)
+            )
+
+        result = await (await self._reader()).execute(statement)
+        users = list(result.scalars())
+        return users[:limit], len(users) > limit
+
     async def update_user(
-        self, user_id: UUID, user_data: BaseUserSchema
+        self,
+        user_id: UUID,
+        user_data: BaseUserSchema,
+        expected_versions: set[int] | None = None,
     ) -> User:
-        user = await self.get_user_by_id(user_id)
-        for key, value in user_data.model_dump(exclude_unset=True).items():
-            setattr(user, key, value)
+        """
+        With expected_versions (from If-Match), the update only applies
+        while the user is still at one of them, in the same statement,
+        and a concurrent change is reported as 412 instead of being
+        overwritten.
+        """
+        if self.cache is not None:
+            await self.cache.invalidate(user_id)
+        values = user_data.model_dump(exclude_unset=True)
+        if 'email' in values:
+            values['email_normalized'] = normalize_email(values['email'])
+        statement = update(User).where(User.uuid == user_id)
+        if expected_versions is not None:
+            statement = statement.where(User.version.in_(expected_versions))
+        result = await self.db_session.execute(
+            statement.values(**values, version=User.version + 1).returning(
+                User
+            )
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            exists = (
+                expected_versions is not None
+                and await self._select_version(self.db_session, user_id)
+                is not None
+            )
+            # End the write transaction the UPDATE opened before failing.
+            await self.db_session.rollback()
+            if exists:
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail='user was modified.',
+                )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail='user not found.'
+            )
         await self.db_session.commit()
-        await self.db_session.refresh(user)
+        await read_router.note_write(user_id)
+        if self.cache is not None:
+            # Again after the commit: a miss that loaded the old row
+            # while the UPDATE ran may have stored it since.
+            await self.cache.invalidate(user_id)
+            await self.cache.store(user_snapshot(user))
         return user
 
+    async def update_password(
+        self,
+        user_id: UUID,
+        password_hash: str,
+        expected_hash: str | None = None,
+    ) -> bool:
+        """
+        With expected_hash, the password is only replaced while it is
+        still that hash. Returns whether it was replaced.
+        """
+        statement = update(User).where(User.uuid == user_id)
+        if expected_hash is not None:
+            statement = statement.where(User.password == expected_hash)
+        result = await self.db_session.execute(
+            statement.values(password=password_hash).returning(User.uuid)
+        )
+        if not result.all():
+            return False
+        await read_router.note_write(user_id)
+        if self.cache is not None:
+            await self.cache.invalidate(user_id)
+        return True
+
     async def delete_user(self, user_id: UUID) -> None:
-        user = await self.get_user_by_id(user_id)
-        await self.db_session.delete(user)
+        result = await self.db_session.execute(
+            delete(User).where(User.uuid == user_id).returning(User.uuid)
+        )
+        if not result.all():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail='user not found.'
+            )
         await self.db_session.commit()
+        await read_router.note_write(user_id)
+        if self.cache is not None:
+            await self.cache.invalidate(user_id)
@@ -2,12 +2,14 @@ from datetime import date
 from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, constr, field_validator
+from pydantic import BaseModel, Field, constr, field_validator
 
 from app.user.utils.validators import validate_email, validate_password
 
 MIN_NAME_LENGTH = 3
 MIN_PASSWORD_LENGTH = 6
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
 
 
 class BaseUserSchema(BaseModel):
@@ -47,3 +49,61 @@ class UserCreate(BaseUserSchema):
 
 class UserResponse(BaseUserSchema):
     uuid: UUID
+
+
+class UserFilter(BaseModel):
+    email_prefix: Optional[str] = None
+    name: Optional[str] = None
+    born_from: Optional[date] = None
+    born_to: Optional[date] = None
+
+
+class UserListQuery(UserFilter):
+    cursor: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+
+class UserPage(BaseModel):
+    items: list[UserResponse]
+    next_cursor: Optional[str] = None
+
+
+class UserBatchRequest(BaseModel):
+    ids: list[UUID]
+
+
+class UserBatchResponse(BaseModel):
+    users: dict[UUID, UserResponse]
+    missing: list[UUID]
+
+
+class TokenUser(BaseModel):
+    """
+    The authenticated caller, as described by the access token claims.
+    """
+
+    uuid: UUID
+    email: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> 'TokenUser':
+        return cls(**{**payload.get('user', {}), 'uuid': payload['sub']})
+
+
+class UserMeResponse(TokenUser):
+    social_name: Optional[str] = None
+    date_of_birth: Optional[date] = None
+
+
+class BulkRowError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    detail: str
+
+
+class BulkImportResponse(BaseModel):
+    created: int = 0
+    failed: int = 0
+    errors: list[BulkRowError] = []
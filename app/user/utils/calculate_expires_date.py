@@ -7,3 +7,10 @@ def expires_date(token_expires_in: int) -> datetime:
     )
 
     return expires_datetime
+
+
+def is_expired(expires_at: datetime) -> bool:
+    # SQLite hands timezone-aware columns back as naive UTC datetimes.
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= datetime.now(timezone.utc)
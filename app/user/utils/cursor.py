@@ -0,0 +1,28 @@
+import base64
+import json
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(position: dict) -> str:
+    """
+    Opaque token for a position in an ordered listing. Clients should
+    only hand it back, never build or inspect it.
+    """
+    data = json.dumps(position, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str, *keys: str) -> dict:
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        position = None
+    if not isinstance(position, dict) or not all(
+        key in position for key in keys
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid cursor.'
+        )
+    return position
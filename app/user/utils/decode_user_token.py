@@ -1,32 +1,58 @@
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.revocation import revocation_list
 from app.config.settings import get_config
+from app.system.database.connection import get_db
+from app.system.database.lazy_session import release_connection
+from app.system.metrics.registry import register
+from app.system.security.keys import key_ring
+from app.user.schema import TokenUser
+from app.user.utils.token_cache import TokenCache
 
 load_dotenv()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='token')
 
-SECRET_KEY = get_config().SECRET_KEY
-ALGORITHM = get_config().ALGORITHM
-
-
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_uuid: str = payload.get('sub')
-        if user_uuid is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail='Token inválido',
-                headers={'WWW-Authenticate': 'Bearer'},
-            )
-        return {'user_uuid': user_uuid}
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail='Token inválido',
-            headers={'WWW-Authenticate': 'Bearer'},
-        )
+token_cache = TokenCache(max_size=get_config().JWT_CACHE_MAX_SIZE)
+register('token_cache', token_cache.stats)
+register('revocation_list', revocation_list.stats)
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail='Token inválido',
+        headers={'WWW-Authenticate': 'Bearer'},
+    )
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db_session: AsyncSession = Depends(get_db),
+) -> TokenUser:
+    current_user = token_cache.get(token)
+    if current_user is None:
+        try:
+            payload = key_ring.decode(token)
+        except JWTError:
+            raise _invalid_token()
+        if payload.get('sub') is None:
+            raise _invalid_token()
+        try:
+            current_user = TokenUser.from_claims(payload)
+        except ValidationError:
+            raise _invalid_token()
+        token_cache.set(token, current_user, payload.get('exp'))
+
+    revoked = await revocation_list.is_revoked(db_session, token)
+    # The endpoint may not need the primary at all, or not until later.
+    await release_connection(db_session)
+    if revoked:
+        token_cache.discard(token)
+        raise _invalid_token()
+    return current_user
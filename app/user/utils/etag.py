@@ -0,0 +1,20 @@
+def user_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def etag_versions(header: str, weak: bool = False) -> set[int] | None:
+    """
+    Versions listed in an If-Match or If-None-Match header, or None for
+    `*`. Weak tags only count with `weak=True`, since If-Match requires
+    a strong comparison; tags this service never issued are ignored.
+    """
+    if header.strip() == '*':
+        return None
+    versions = set()
+    for entry in header.split(','):
+        tag = entry.strip()
+        if weak:
+            tag = tag.removeprefix('W/')
+        if tag.startswith('"') and tag.endswith('"') and tag[1:-1].isdigit():
+            versions.add(int(tag[1:-1]))
+    return versions
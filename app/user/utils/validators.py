@@ -10,6 +10,14 @@ def validate_email(email: str):
     return email
 
 
+def normalize_email(email: str) -> str:
+    """
+    The form emails are compared in: addresses differing only in case
+    or surrounding whitespace belong to the same account.
+    """
+    return email.strip().lower()
+
+
 def validate_password(password: str):
     MIN_PASSWORD_LENGTH = 6
 
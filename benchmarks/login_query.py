@@ -0,0 +1,104 @@
+"""
+Login lookup throughput: full ORM entity versus the projected Core row.
+
+Both variants look the same user up by normalized email in a fresh
+session per iteration, as each login request does, and read the five
+fields needed to issue a token. Password verification is left out so
+only the query path is measured.
+
+    python -m benchmarks.login_query --iterations 5000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import date
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./bench_db.sqlite')
+
+from sqlalchemy import select  # noqa: E402
+
+from app.auth.repository import LOGIN_QUERY  # noqa: E402
+from app.system.database.connection import database  # noqa: E402
+from app.user.models import Base, User  # noqa: E402
+
+EMAIL = 'bench@example.com'
+
+
+def read_fields(user) -> tuple:
+    return (
+        user.uuid,
+        user.password,
+        user.first_name,
+        user.last_name,
+        user.email,
+    )
+
+
+async def orm_entity() -> tuple:
+    async with database.session() as session:
+        result = await session.execute(
+            select(User).filter_by(email_normalized=EMAIL)
+        )
+        return read_fields(result.scalar_one())
+
+
+async def core_row() -> tuple:
+    async with database.session() as session:
+        connection = await session.connection()
+        result = await connection.execute(LOGIN_QUERY, {'email': EMAIL})
+        return read_fields(result.one())
+
+
+VARIANTS = {'orm entity': orm_entity, 'core row': core_row}
+
+
+async def measure(lookup, iterations: int) -> float:
+    for _ in range(min(iterations, 200)):
+        await lookup()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await lookup()
+    return time.perf_counter() - started
+
+
+async def main(iterations: int, rounds: int):
+    async with database.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with database.session() as session:
+        session.add(
+            User(
+                email=EMAIL,
+                first_name='Bench',
+                last_name='Mark',
+                date_of_birth=date(1990, 1, 1),
+                password='not-a-real-hash',
+            )
+        )
+        await session.commit()
+
+    assert await orm_entity() == await core_row()
+
+    best = {}
+    for _ in range(rounds):
+        for name, lookup in VARIANTS.items():
+            elapsed = await measure(lookup, iterations)
+            best[name] = min(best.get(name, elapsed), elapsed)
+    await database.dispose()
+
+    print(f'{"":>12} {"logins/s":>10} {"us/login":>10}')
+    for name, elapsed in best.items():
+        print(
+            f'{name:>12} {iterations / elapsed:10.0f} '
+            f'{elapsed / iterations * 1e6:10.1f}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=5000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.rounds))
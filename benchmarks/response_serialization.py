@@ -0,0 +1,95 @@
+"""
+Response rendering cost: FastAPI's default path versus FastJSONResponse.
+
+The default path is what a route returning a model used to go through:
+`serialize_response` dumps the model, validates it again against
+`response_model`, converts it to JSON-compatible data and
+`JSONResponse` encodes that with `json.dumps`. FastJSONResponse renders
+the model in one pydantic-core pass. Payloads are a single
+`UserResponse`, a 50-user `UserPage` and an `AccessToken`.
+
+    python -m benchmarks.response_serialization --iterations 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.auth.schemas import AccessToken
+from app.system.responses.json_response import FastJSONResponse
+from app.user.schema import UserPage, UserResponse
+
+
+def user(index: int) -> UserResponse:
+    return UserResponse(
+        uuid=uuid4(),
+        email=f'bench{index}@example.com',
+        first_name='Bench',
+        last_name='Mark',
+        social_name=None,
+        date_of_birth=date(1990, 1, 1),
+    )
+
+
+PAYLOADS = {
+    'UserResponse': user(0),
+    'UserPage[50]': UserPage(items=[user(index) for index in range(50)]),
+    'AccessToken': AccessToken(
+        token='header.' + 'x' * 600 + '.signature',
+        expires_in=900,
+        refresh_token='r' * 43,
+    ),
+}
+
+
+async def default_path(field, payload) -> bytes:
+    content = await serialize_response(field=field, response_content=payload)
+    return JSONResponse(content).body
+
+
+async def fast_path(field, payload) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+VARIANTS = {'default': default_path, 'fast': fast_path}
+
+
+async def measure(render, field, payload, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await render(field, payload)
+    return time.perf_counter() - started
+
+
+async def main(iterations: int, rounds: int):
+    print(f'{"payload":<14} {"path":>8} {"renders/s":>12} {"us/render":>10}')
+    for name, payload in PAYLOADS.items():
+        field = create_model_field(name='Response', type_=type(payload))
+        assert json.loads(await default_path(field, payload)) == json.loads(
+            await fast_path(field, payload)
+        )
+        best = {}
+        for _ in range(rounds):
+            for path, render in VARIANTS.items():
+                elapsed = await measure(render, field, payload, iterations)
+                best[path] = min(best.get(path, elapsed), elapsed)
+        for path, elapsed in best.items():
+            print(
+                f'{name:<14} {path:>8} {iterations / elapsed:12.0f} '
+                f'{elapsed / iterations * 1e6:10.2f}'
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.rounds))
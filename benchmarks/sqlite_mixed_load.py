@@ -0,0 +1,161 @@
+"""
+Mixed read/write throughput on SQLite, today's setup versus
+SQLITE_PRODUCTION_MODE.
+
+Concurrent workers run request-shaped units of work against a seeded
+users table: mostly `get_user_response` lookups, and for `--writes` of
+them a version read followed by `update_user`. The default setup runs
+everything on one pool of rollback-journal connections, where a commit
+waits for readers to let go of the file; production mode writes
+through a single WAL connection and reads from a query-only pool.
+Units failing with "database is locked" or similar are counted rather
+than retried.
+
+    python -m benchmarks.sqlite_mixed_load --operations 5000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import date
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./bench_db.sqlite')
+os.environ.setdefault('USER_CACHE_ENABLED', 'false')
+
+from sqlalchemy import exc, insert  # noqa: E402
+
+from app.auth import models as auth_models  # noqa: E402, F401
+from app.config.settings import get_config  # noqa: E402
+from app.system.database.connection import Database  # noqa: E402
+from app.system.database.ids import new_uuid  # noqa: E402
+from app.system.database.sqlite import (  # noqa: E402
+    WRITER_POOL,
+    production_pragmas,
+)
+from app.user.models import Base, User  # noqa: E402
+from app.user.repository import UserRepository  # noqa: E402
+from app.user.schema import BaseUserSchema  # noqa: E402
+
+
+def default_setup(url: str) -> tuple[Database, Database]:
+    database = Database(url)
+    return database, database
+
+
+def production_setup(url: str) -> tuple[Database, Database]:
+    pragmas = production_pragmas(get_config())
+    return (
+        Database(url, pool=WRITER_POOL, pragmas=pragmas),
+        Database(url, pragmas=(*pragmas, 'PRAGMA query_only=ON')),
+    )
+
+
+SETUPS = {'default': default_setup, 'production': production_setup}
+
+
+async def seed(writer: Database, users: int) -> list:
+    async with writer.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    ids = [new_uuid() for _ in range(users)]
+    async with writer.engine.begin() as conn:
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    'uuid': user_id,
+                    'email': f'bench{index}@example.com',
+                    'email_normalized': f'bench{index}@example.com',
+                    'first_name': 'Bench',
+                    'last_name': 'Mark',
+                    'date_of_birth': date(1990, 1, 1),
+                    'password': 'not-a-real-hash',
+                }
+                for index, user_id in enumerate(ids)
+            ],
+        )
+    return ids
+
+
+async def read(writer: Database, reader: Database, user_id) -> None:
+    async with writer.session() as db_session, reader.session() as read:
+        repository = UserRepository(
+            db_session=db_session, cache=None, read_session=read
+        )
+        await repository.get_user_response(user_id)
+
+
+async def write(writer: Database, user_id, index: int) -> None:
+    async with writer.session() as db_session:
+        repository = UserRepository(db_session=db_session, cache=None)
+        await repository.get_user_version(user_id)
+        await repository.update_user(
+            user_id,
+            BaseUserSchema(
+                email=f'{user_id.hex}@example.com',
+                first_name=f'Bench{index}',
+                last_name='Mark',
+                date_of_birth=date(1990, 1, 1),
+            ),
+        )
+
+
+async def run(name: str, args) -> tuple[float, int, int]:
+    path = Path(f'bench_{name}.sqlite')
+    writer, reader = SETUPS[name](f'sqlite+aiosqlite:///{path}')
+    ids = await seed(writer, args.users)
+    rng = random.Random(0)
+    plan = [
+        (rng.random() < args.writes, rng.choice(ids))
+        for _ in range(args.operations)
+    ]
+    writes = sum(is_write for is_write, _ in plan)
+    failures = 0
+
+    async def worker(start: int):
+        nonlocal failures
+        for index in range(start, len(plan), args.concurrency):
+            is_write, user_id = plan[index]
+            try:
+                if is_write:
+                    await write(writer, user_id, index)
+                else:
+                    await read(writer, reader, user_id)
+            except exc.OperationalError:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    await writer.dispose()
+    await reader.dispose()
+    for suffix in ('', '-wal', '-shm'):
+        Path(f'{path}{suffix}').unlink(missing_ok=True)
+    return elapsed, writes, failures
+
+
+async def main(args):
+    print(
+        f'{args.operations} units, {args.writes:.0%} writes, '
+        f'{args.concurrency} concurrent'
+    )
+    print(f'{"mode":>10} {"units/s":>10} {"writes":>8} {"failed":>8}')
+    for name in SETUPS:
+        elapsed, writes, failures = await run(name, args)
+        print(
+            f'{name:>10} {args.operations / elapsed:10.0f} '
+            f'{writes:8d} {failures:8d}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--operations', type=int, default=5000)
+    parser.add_argument('--writes', type=float, default=0.2)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,107 @@
+"""
+SQL statements and commits issued per write endpoint.
+
+Runs the app in-process over ASGI against a throwaway SQLite file, with
+the user cache off and authentication stubbed out, and counts what the
+engine sends for each call of `POST /user/`, `PUT /user/{id}`,
+`DELETE /user/{id}` and `GET /user/{id}`. Every statement is one round
+trip to the database, so on a remote PostgreSQL the counts translate
+directly into request latency.
+
+    python -m benchmarks.statements_per_endpoint --users 50
+"""
+
+import argparse
+import asyncio
+import os
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./bench_db.sqlite')
+os.environ.setdefault('USER_CACHE_ENABLED', 'false')
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.system.database.connection import database  # noqa: E402
+from app.user.models import Base  # noqa: E402
+from app.user.schema import TokenUser  # noqa: E402
+from app.user.utils.decode_user_token import get_current_user  # noqa: E402
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+
+    def on_execute(self, *args):
+        self.statements += 1
+
+    def on_commit(self, *args):
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+def user_payload(index: int) -> dict:
+    return {
+        'email': f'bench{index}@example.com',
+        'first_name': 'Bench',
+        'last_name': 'Mark',
+        'date_of_birth': '1990-01-01',
+        'password': 'SecurePass!',
+    }
+
+
+async def main(users: int):
+    async with database.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    counter = StatementCounter()
+    sync_engine = database.engine.sync_engine
+    event.listen(sync_engine, 'before_cursor_execute', counter.on_execute)
+    event.listen(sync_engine, 'commit', counter.on_commit)
+    app.dependency_overrides[get_current_user] = lambda: TokenUser(
+        uuid='00000000-0000-0000-0000-000000000000'
+    )
+
+    totals: dict[str, list[int]] = {}
+
+    async def measure(name: str, request):
+        counter.reset()
+        response = await request
+        response.raise_for_status()
+        total = totals.setdefault(name, [0, 0])
+        total[0] += counter.statements
+        total[1] += counter.commits
+        return response
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url='http://bench') as c:
+        for index in range(users):
+            created = await measure(
+                'POST /user/', c.post('/user/', json=user_payload(index))
+            )
+            path = f'/user/{created.json()["uuid"]}'
+            await measure('GET /user/{id}', c.get(path))
+            update = user_payload(index)
+            del update['password']
+            update['first_name'] = 'Updated'
+            await measure('PUT /user/{id}', c.put(path, json=update))
+            await measure('DELETE /user/{id}', c.delete(path))
+
+    app.dependency_overrides.pop(get_current_user)
+    await database.dispose()
+
+    print(f'{"endpoint":<20} {"statements":>12} {"commits":>10}')
+    for name, (statements, commits) in totals.items():
+        print(f'{name:<20} {statements / users:12.2f} {commits / users:10.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.users))
@@ -0,0 +1,92 @@
+"""
+`GET /user/{id}` throughput on the ORM read path versus the Core one.
+
+Runs the app in-process over ASGI against a throwaway SQLite file with
+the user cache off and authentication stubbed out, so every request
+reaches the database. The ORM path builds a `User` entity, validates it
+into `UserResponse` and lets FastAPI validate the result again against
+`response_model`; the Core path (`USER_FAST_READ_ENDPOINTS=get_user`)
+maps the selected row into `UserResponse` once and serializes it
+directly.
+
+    python -m benchmarks.user_read_path --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import date
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./bench_db.sqlite')
+os.environ.setdefault('USER_CACHE_ENABLED', 'false')
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.system.database.connection import database  # noqa: E402
+from app.user import endpoints  # noqa: E402
+from app.user.models import Base, User  # noqa: E402
+from app.user.schema import TokenUser  # noqa: E402
+from app.user.utils.decode_user_token import get_current_user  # noqa: E402
+
+VARIANTS = {'orm': set(), 'core': {'get_user'}}
+
+
+async def measure(client: AsyncClient, path: str, requests: int) -> float:
+    for _ in range(min(requests, 200)):
+        (await client.get(path)).raise_for_status()
+    started = time.perf_counter()
+    for _ in range(requests):
+        (await client.get(path)).raise_for_status()
+    return time.perf_counter() - started
+
+
+async def main(requests: int, rounds: int):
+    async with database.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with database.session() as session:
+        user = User(
+            email='bench@example.com',
+            first_name='Bench',
+            last_name='Mark',
+            date_of_birth=date(1990, 1, 1),
+            password='not-a-real-hash',
+        )
+        session.add(user)
+        await session.commit()
+    path = f'/user/{user.uuid}'
+    app.dependency_overrides[get_current_user] = lambda: TokenUser(
+        uuid=user.uuid
+    )
+
+    best = {}
+    bodies = {}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url='http://bench') as c:
+        for _ in range(rounds):
+            for name, fast_endpoints in VARIANTS.items():
+                endpoints.FAST_READ_ENDPOINTS = fast_endpoints
+                bodies[name] = (await c.get(path)).json()
+                elapsed = await measure(c, path, requests)
+                best[name] = min(best.get(name, elapsed), elapsed)
+    app.dependency_overrides.pop(get_current_user)
+    await database.dispose()
+
+    assert bodies['orm'] == bodies['core']
+
+    print(f'{"path":>6} {"requests/s":>12} {"us/request":>12}')
+    for name, elapsed in best.items():
+        print(
+            f'{name:>6} {requests / elapsed:12.0f} '
+            f'{elapsed / requests * 1e6:12.1f}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds))
@@ -0,0 +1,86 @@
+"""
+Insert throughput and primary-key index size, uuid4 versus uuid7 keys.
+
+Fills a scratch table keyed like `users` with each generator in turn,
+committing every `--batch` rows, and reports rows/s and the size of the
+primary-key index afterwards. Random uuid4 keys land on arbitrary
+B-tree pages, so pages split half-full and inserts touch pages all over
+the index; uuid7 keys append to the rightmost page. Runs against
+DATABASE_URL, so point it at PostgreSQL to compare there.
+
+    python -m benchmarks.uuid_inserts --rows 200000
+    DATABASE_URL=postgresql://... python -m benchmarks.uuid_inserts
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./bench_db.sqlite')
+
+from sqlalchemy import Column, MetaData, String, Table, text  # noqa: E402
+from sqlalchemy.dialects.postgresql import UUID  # noqa: E402
+
+from app.system.database.connection import database  # noqa: E402
+from app.system.database.ids import uuid7  # noqa: E402
+
+metadata = MetaData()
+bench_ids = Table(
+    'bench_ids',
+    metadata,
+    Column('uuid', UUID(as_uuid=True), primary_key=True),
+    Column('email', String, nullable=False),
+)
+
+GENERATORS = {'uuid4': uuid.uuid4, 'uuid7': uuid7}
+INDEX_SIZE = {
+    'sqlite': text(
+        'SELECT sum(pgsize) FROM dbstat '
+        "WHERE name = 'sqlite_autoindex_bench_ids_1'"
+    ),
+    'postgresql': text("SELECT pg_relation_size('bench_ids_pkey')"),
+}
+
+
+async def fill(generate, rows: int, batch: int) -> float:
+    async with database.engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        async with database.engine.begin() as conn:
+            await conn.execute(
+                bench_ids.insert(),
+                [
+                    {'uuid': generate(), 'email': f'bench{index}@example.com'}
+                    for index in range(offset, min(offset + batch, rows))
+                ],
+            )
+    return time.perf_counter() - started
+
+
+async def index_size() -> int:
+    async with database.engine.connect() as conn:
+        return await conn.scalar(INDEX_SIZE[database.engine.dialect.name])
+
+
+async def main(rows: int, batch: int):
+    print(f'{database.engine.dialect.name}, {rows} rows, {batch} per commit')
+    print(f'{"key":>6} {"rows/s":>10} {"index MiB":>10}')
+    for name, generate in GENERATORS.items():
+        elapsed = await fill(generate, rows, batch)
+        size = await index_size()
+        print(f'{name:>6} {rows / elapsed:10.0f} {size / 2**20:10.2f}')
+    async with database.engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+    await database.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--batch', type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch))
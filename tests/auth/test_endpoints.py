@@ -3,12 +3,16 @@ from dotenv import load_dotenv
 from fastapi import status
 from httpx import AsyncClient
 from jose import jwt
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy.future import select
 
 from app.config.settings import get_config
 from app.user.models import ResetPasswordToken, User
 from app.auth.repository import AuthRepository
-from app.system.security.security import verify_password
+from app.system.security.security import (
+    password_needs_rehash,
+    verify_password,
+)
 
 load_dotenv()
 token_expires_in = int(get_config().AUTH_TOKEN_EXPIRES)
@@ -88,3 +92,76 @@ async def test_change_password(
     assert token_on_db is None
     await db_session.refresh(create_user)
     assert verify_password('Test123!', create_user.password)
+
+
+@pytest.mark.asyncio
+async def test_auth_rehashes_stale_password(
+    client: AsyncClient, create_user: User, setup_db, db_session
+):
+    create_user.password = Argon2Hasher(time_cost=1, memory_cost=8192).hash(
+        'SecurePass!'
+    )
+    await db_session.commit()
+
+    response = await client.post(
+        '/auth/',
+        data={'username': create_user.email, 'password': 'SecurePass!'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    await db_session.refresh(create_user)
+    assert not password_needs_rehash(create_user.password)
+
+
+@pytest.mark.asyncio
+async def test_jwks(client: AsyncClient):
+    response = await client.get('/auth/.well-known/jwks.json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'keys' in response.json()
+    assert 'max-age=' in response.headers['cache-control']
+
+
+@pytest.mark.asyncio
+async def test_refresh(client: AsyncClient, create_user: User, setup_db):
+    login = await client.post(
+        '/auth/',
+        data={'username': create_user.email, 'password': 'SecurePass!'},
+    )
+
+    response = await client.post(
+        '/auth/refresh',
+        json={'refresh_token': login.json()['refresh_token']},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['token'] is not None
+    assert response.json()['refresh_token'] != login.json()['refresh_token']
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_invalid_token(client: AsyncClient, setup_db):
+    response = await client.post(
+        '/auth/refresh', json={'refresh_token': 'not-a-refresh-token'}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_revoke_refresh_token(
+    client: AsyncClient, create_user: User, setup_db
+):
+    login = await client.post(
+        '/auth/',
+        data={'username': create_user.email, 'password': 'SecurePass!'},
+    )
+    refresh_token = login.json()['refresh_token']
+
+    response = await client.post('/auth/revoke', json={'token': refresh_token})
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.post(
+        '/auth/refresh', json={'refresh_token': refresh_token}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,14 +1,23 @@
+import asyncio
+
 import pytest
 from dotenv import load_dotenv
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from jose import jwt
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.auth.models import RefreshToken
 from app.auth.repository import AuthRepository
+from app.auth.revocation import revocation_list, token_digest
 from app.auth.schemas import AccessToken
 from app.config.settings import get_config
-from app.system.security.security import verify_password
+from app.system.database.connection import database
+from app.system.security.security import (
+    password_needs_rehash,
+    verify_password,
+)
 from app.user.models import User, ResetPasswordToken
 
 load_dotenv()
@@ -87,4 +96,152 @@ async def test_change_password_with_invalid_token(db_session:AsyncSession, creat
         await repository.change_user_password(token='klafsnklSFN', new_password='Test123!')
 
         assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-        
\ No newline at end of file
+        
+
+@pytest.mark.asyncio
+async def test_authenticate_rehashes_stale_password(
+    db_session: AsyncSession, create_user: User
+):
+    create_user.password = Argon2Hasher(time_cost=1, memory_cost=8192).hash(
+        'SecurePass!'
+    )
+    await db_session.commit()
+    repository = AuthRepository(db_session)
+
+    await repository.authenticate(
+        email=create_user.email, password='SecurePass!'
+    )
+
+    await db_session.refresh(create_user)
+    assert not password_needs_rehash(create_user.password)
+    assert verify_password('SecurePass!', create_user.password)
+
+
+@pytest.mark.asyncio
+async def test_rehash_does_not_undo_password_reset(
+    db_session: AsyncSession, create_user: User
+):
+    create_user.password = Argon2Hasher(time_cost=1, memory_cost=8192).hash(
+        'SecurePass!'
+    )
+    await db_session.commit()
+    repository = AuthRepository(db_session)
+    background_tasks = BackgroundTasks()
+
+    await repository.authenticate(
+        email=create_user.email,
+        password='SecurePass!',
+        background_tasks=background_tasks,
+    )
+    token = await repository.create_token(create_user)
+    await repository.change_user_password(token, new_password='Test123!')
+    await background_tasks()
+
+    await db_session.refresh(create_user)
+    assert verify_password('Test123!', create_user.password)
+    assert not verify_password('SecurePass!', create_user.password)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_issues_refresh_token(db_session, create_user):
+    repository = AuthRepository(db_session)
+
+    result = await repository.authenticate(
+        email=create_user.email, password='SecurePass!'
+    )
+
+    stored = await db_session.get(
+        RefreshToken, token_digest(result.refresh_token)
+    )
+    assert stored is not None
+    assert stored.user_id == create_user.uuid
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_refresh_token(db_session, create_user):
+    repository = AuthRepository(db_session)
+    login = await repository.authenticate(
+        email=create_user.email, password='SecurePass!'
+    )
+
+    refreshed = await repository.refresh(login.refresh_token)
+
+    assert refreshed.refresh_token != login.refresh_token
+    token: dict = jwt.decode(
+        refreshed.token, SECRET_KEY, algorithms=[ALGORITHM]
+    )
+    assert token['sub'] == str(create_user.uuid)
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_family(db_session, create_user):
+    repository = AuthRepository(db_session)
+    login = await repository.authenticate(
+        email=create_user.email, password='SecurePass!'
+    )
+    refreshed = await repository.refresh(login.refresh_token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await repository.refresh(login.refresh_token)
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    with pytest.raises(HTTPException):
+        await repository.refresh(refreshed.refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_with_one_token(db_session, create_user):
+    login = await AuthRepository(db_session).authenticate(
+        email=create_user.email, password='SecurePass!'
+    )
+
+    async def refresh():
+        async with database.session() as session:
+            try:
+                await AuthRepository(session).refresh(login.refresh_token)
+            except HTTPException as error:
+                return error.status_code
+            return status.HTTP_200_OK
+
+    results = await asyncio.gather(refresh(), refresh())
+
+    assert sorted(results) == [
+        status.HTTP_200_OK,
+        status.HTTP_401_UNAUTHORIZED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_revoke_access_token(db_session, create_user):
+    repository = AuthRepository(db_session)
+    login = await repository.authenticate(
+        email=create_user.email, password='SecurePass!'
+    )
+    assert not await revocation_list.is_revoked(db_session, login.token)
+
+    await repository.revoke_token(login.token)
+
+    assert await revocation_list.is_revoked(db_session, login.token)
+
+
+@pytest.mark.asyncio
+async def test_reset_token_is_consumed_once(db_session, create_user):
+    repository = AuthRepository(db_session)
+    token = await repository.create_token(create_user)
+    await repository.change_user_password(token, new_password='Test123!')
+
+    with pytest.raises(HTTPException) as exc_info:
+        await repository.change_user_password(token, new_password='Other12!')
+
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_authenticate_ignores_email_case(db_session, create_user):
+    repository = AuthRepository(db_session)
+
+    result = await repository.authenticate(
+        email=' ValidUser@EXAMPLE.com', password='SecurePass!'
+    )
+
+    assert result.refresh_token is not None
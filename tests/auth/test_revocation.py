@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select
+
+from app.auth.models import RevokedToken
+from app.auth.revocation import RevocationList, token_digest
+
+
+@pytest_asyncio.fixture
+async def revoked_tokens(db_session):
+    yield db_session
+    await db_session.execute(delete(RevokedToken))
+    await db_session.commit()
+
+
+def make_list(capacity: int = 100) -> RevocationList:
+    return RevocationList(
+        capacity=capacity, error_rate=0.001, sync_interval=5, sync_overlap=60
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_sees_rows_committed_late(revoked_tokens):
+    session = revoked_tokens
+    revocations = make_list()
+    await revocations.sync(session)
+
+    # A row stamped before the last sync that only commits after it, as
+    # a slow transaction on another worker would.
+    session.add(
+        RevokedToken(
+            token_digest=token_digest('late'),
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+            created_at=datetime.now(timezone.utc) - timedelta(seconds=30),
+        )
+    )
+    await session.commit()
+    await revocations.sync(session)
+
+    assert await revocations.is_revoked(session, 'late')
+
+
+@pytest.mark.asyncio
+async def test_rebuild_purges_expired_rows(revoked_tokens):
+    session = revoked_tokens
+    now = datetime.now(timezone.utc)
+    lifetimes = {'token0': 1, 'token1': 1, 'token2': 1, 'token3': -1}
+    for token, hours in lifetimes.items():
+        session.add(
+            RevokedToken(
+                token_digest=token_digest(token),
+                expires_at=now + timedelta(hours=hours),
+            )
+        )
+    await session.commit()
+    revocations = make_list(capacity=2)
+
+    await revocations.sync(session)
+    await revocations.sync(session)
+
+    remaining = await session.scalar(
+        select(func.count()).select_from(RevokedToken)
+    )
+    assert remaining == 3  # noqa: PLR2004
+    assert revocations.rebuilds == 1
+    assert await revocations.is_revoked(session, 'token0')
+    assert not await revocations.is_revoked(session, 'token3')
@@ -10,8 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
 from app.system.database.base import Base
-from app.system.database.connection import Session, engine, get_db
+from app.system.database.connection import database, get_db
 from app.system.security.security import get_password_hash
+from app.user.cache import user_cache
 from app.user.models import User
 from app.user.utils.decode_user_token import get_current_user
 
@@ -30,7 +31,7 @@ def event_loop():
 
 @pytest_asyncio.fixture
 async def db_session():
-    async with Session() as session:
+    async with database.session() as session:
         try:
             yield session
         except Exception as e:
@@ -83,14 +84,14 @@ async def create_user(db_session: AsyncSession):
 
 @pytest.fixture
 async def setup_db():
-    async with engine.begin() as conn:
+    async with database.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    session = Session()
+    session = database.session()
     yield session
 
     await session.close()
-    async with engine.begin() as conn:
+    async with database.engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
@@ -105,3 +106,11 @@ def override_get_db(setup_db):
 @pytest.fixture(autouse=True)
 def override_dependency(override_get_db):
     app.dependency_overrides[get_db] = override_get_db
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_user_cache():
+    # Fixtures write users straight through the session, bypassing the
+    # repository's cache invalidation.
+    if user_cache is not None:
+        await user_cache.clear()
@@ -0,0 +1,122 @@
+import asyncio
+import fnmatch
+import time
+
+
+class RespServer:
+    """
+    In-process stand-in for a Redis server: strings with PX expiry,
+    MGET, DEL, SCAN, PUBLISH and SUBSCRIBE over RESP2.
+    """
+
+    def __init__(self):
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self.port: int | None = None
+        # Seconds to wait before each reply, to catch a client mid-call.
+        self.reply_delay = 0.0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f'redis://127.0.0.1:{self.port}/0'
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for writers in self.subscribers.values():
+            for writer in writers:
+                writer.close()
+        self._server.close()
+        await self._server.wait_closed()
+
+    @staticmethod
+    def _bulk(value: bytes | None) -> bytes:
+        if value is None:
+            return b'$-1\r\n'
+        return b'$%d\r\n%s\r\n' % (len(value), value)
+
+    def _array(self, items: list) -> bytes:
+        parts = [b'*%d\r\n' % len(items)]
+        for item in items:
+            if isinstance(item, list):
+                parts.append(self._array(item))
+            elif isinstance(item, int):
+                parts.append(b':%d\r\n' % item)
+            else:
+                parts.append(self._bulk(item))
+        return b''.join(parts)
+
+    def _get(self, key: bytes) -> bytes | None:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader):
+        header = await reader.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while (args := await self._read_command(reader)) is not None:
+                if self.reply_delay:
+                    await asyncio.sleep(self.reply_delay)
+                writer.write(self._dispatch(args, writer))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for writers in self.subscribers.values():
+                writers.discard(writer)
+            writer.close()
+
+    def _dispatch(self, args: list[bytes], writer) -> bytes:  # noqa: PLR0911
+        command = args[0].upper()
+        if command in {b'PING', b'SELECT', b'AUTH'}:
+            return b'+OK\r\n'
+        if command == b'GET':
+            return self._bulk(self._get(args[1]))
+        if command == b'MGET':
+            return self._array([self._get(key) for key in args[1:]])
+        if command == b'SET':
+            expires_at = None
+            if len(args) == 5 and args[3].upper() == b'PX':  # noqa: PLR2004
+                expires_at = time.monotonic() + int(args[4]) / 1000
+            self.data[args[1]] = (args[2], expires_at)
+            return b'+OK\r\n'
+        if command == b'DEL':
+            removed = sum(
+                self.data.pop(key, None) is not None for key in args[1:]
+            )
+            return b':%d\r\n' % removed
+        if command == b'SCAN':
+            pattern = args[args.index(b'MATCH') + 1].decode()
+            keys = [
+                key
+                for key in list(self.data)
+                if fnmatch.fnmatchcase(key.decode(), pattern)
+            ]
+            return self._array([b'0', keys])
+        if command == b'PUBLISH':
+            writers = self.subscribers.get(args[1], set())
+            for subscriber in writers:
+                subscriber.write(self._array([b'message', args[1], args[2]]))
+            return b':%d\r\n' % len(writers)
+        if command == b'SUBSCRIBE':
+            self.subscribers.setdefault(args[1], set()).add(writer)
+            return self._array([b'subscribe', args[1], 1])
+        return b'-ERR unknown command\r\n'
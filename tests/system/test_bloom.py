@@ -0,0 +1,25 @@
+from app.system.security.bloom import BloomFilter
+
+MAX_FALSE_POSITIVES = 300
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f'item-{index}'.encode() for index in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == len(items)
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(f'item-{index}'.encode())
+
+    false_positives = sum(
+        f'other-{index}'.encode() in bloom for index in range(10000)
+    )
+
+    assert false_positives < MAX_FALSE_POSITIVES
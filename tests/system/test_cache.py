@@ -0,0 +1,42 @@
+import time
+
+from app.system.cache.memory import TTLCache
+
+
+def test_ttl_cache_get_and_set():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set('key', 'value')
+
+    assert cache.get('key') == 'value'
+    assert cache.get('missing') is None
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set('key', 'value')
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 61)
+
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('first', 'first')
+    cache.set('second', 'second')
+    cache.get('first')
+    cache.set('third', 'third')
+
+    assert cache.get('second') is None
+    assert cache.get('first') == 'first'
+    assert cache.get('third') == 'third'
+
+
+def test_ttl_cache_delete():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set('first', 1)
+    cache.set('second', 2)
+    cache.delete('first', 'second', 'missing')
+
+    assert len(cache) == 0
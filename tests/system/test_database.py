@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app import main
+from app.main import app
+from app.system.database.connection import Database
+from app.user.models import Base
+
+WARM_CONNECTIONS = 2
+
+
+@pytest.mark.asyncio
+async def test_database_warm_up_and_dispose(tmp_path):
+    database = Database(f'sqlite+aiosqlite:///{tmp_path / "warm.sqlite"}')
+    assert database.stats()['ready'] is False
+    async with database.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    await database.warm_up(WARM_CONNECTIONS)
+    warm = database.stats()
+    await database.dispose(drain_timeout=1)
+
+    assert warm['ready'] is True
+    assert warm['checked_in'] == WARM_CONNECTIONS
+    assert database.stats()['ready'] is False
+    assert 'checked_in' not in database.stats()
+
+
+@pytest.mark.asyncio
+async def test_readiness_follows_lifespan(client: AsyncClient):
+    before = await client.get('/health/ready')
+    async with app.router.lifespan_context(app):
+        during = await client.get('/health/ready')
+    after = await client.get('/health/ready')
+
+    assert before.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert during.status_code == status.HTTP_200_OK
+    assert during.json() == {'status': 'ready'}
+    assert after.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+class StalledReplica(Database):
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.warming = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def warm_up(self, connections: int) -> None:
+        self.warming.set()
+        await self.release.wait()
+        await super().warm_up(connections)
+
+
+@pytest.mark.asyncio
+async def test_not_ready_until_every_database_is_warm(
+    client: AsyncClient, tmp_path, monkeypatch
+):
+    replica = StalledReplica(f'sqlite+aiosqlite:///{tmp_path / "r.sqlite"}')
+    monkeypatch.setattr(
+        main.read_router, 'replicas', [*main.read_router.replicas, replica]
+    )
+    startup = asyncio.Event()
+    shutdown = asyncio.Event()
+
+    async def run_lifespan():
+        async with app.router.lifespan_context(app):
+            startup.set()
+            await shutdown.wait()
+
+    task = asyncio.create_task(run_lifespan())
+    await replica.warming.wait()
+    while_warming = await client.get('/health/ready')
+    replica.release.set()
+    await startup.wait()
+    warm = await client.get('/health/ready')
+    shutdown.set()
+    await task
+
+    assert main.read_router.primary.stats()['ready'] is False
+    assert while_warming.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert warm.status_code == status.HTTP_200_OK
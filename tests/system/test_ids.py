@@ -0,0 +1,35 @@
+import time
+import uuid
+
+from app.system.database import ids
+from app.system.database.ids import new_uuid, uuid7
+
+UUID_VERSION = 7
+GENERATED_IDS = 10000
+
+
+def test_uuid7_layout():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == UUID_VERSION
+    assert value.variant == uuid.RFC_4122
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_increases_within_a_millisecond(monkeypatch):
+    monkeypatch.setattr(time, 'time_ns', lambda: 1_700_000_000_000_000_000)
+
+    values = [uuid7() for _ in range(GENERATED_IDS)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == GENERATED_IDS
+
+
+def test_new_uuid_follows_configured_version(monkeypatch):
+    assert new_uuid().version == UUID_VERSION
+
+    monkeypatch.setattr(ids, 'PRIMARY_KEY_UUID_VERSION', 4)
+
+    assert new_uuid().version == 4  # noqa: PLR2004
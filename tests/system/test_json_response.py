@@ -0,0 +1,26 @@
+import json
+from datetime import date
+from uuid import uuid4
+
+from app.system.responses.json_response import FastJSONResponse
+from app.user.schema import UserResponse
+
+
+def test_fast_json_response_renders_models():
+    user = UserResponse(
+        uuid=uuid4(),
+        email='render@example.com',
+        first_name='Render',
+        last_name='Test',
+        date_of_birth=date(1990, 1, 1),
+    )
+
+    response = FastJSONResponse(user, status_code=201)
+
+    assert response.status_code == 201  # noqa: PLR2004
+    assert response.headers['content-type'] == 'application/json'
+    assert json.loads(response.body) == user.model_dump(mode='json')
+
+
+def test_fast_json_response_sends_bytes_as_they_are():
+    assert FastJSONResponse(b'{"ready":true}').body == b'{"ready":true}'
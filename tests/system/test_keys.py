@@ -0,0 +1,79 @@
+import pytest
+from jose import jwk, jwt
+from jose.exceptions import JWTError
+
+from app.system.security.keys import KeyRing, generate_private_key
+
+
+def make_key(algorithm: str = 'ES256'):
+    return jwk.construct(generate_private_key(algorithm), algorithm)
+
+
+def test_symmetric_key_ring_signs_with_secret():
+    key_ring = KeyRing(algorithm='HS256', secret='secret')
+
+    token = key_ring.sign({'sub': 'user'})
+
+    assert jwt.decode(token, 'secret', algorithms=['HS256']) == {'sub': 'user'}
+    assert key_ring.decode(token) == {'sub': 'user'}
+    assert key_ring.jwks() == {'keys': []}
+
+
+def test_asymmetric_key_ring_signs_with_active_kid():
+    key_ring = KeyRing(
+        algorithm='ES256',
+        private_keys={'current': make_key()},
+        active_kid='current',
+    )
+
+    token = key_ring.sign({'sub': 'user'})
+
+    assert jwt.get_unverified_header(token)['kid'] == 'current'
+    assert key_ring.decode(token) == {'sub': 'user'}
+
+
+def test_asymmetric_key_ring_verifies_rotated_keys():
+    old_key = make_key()
+    old_ring = KeyRing(
+        algorithm='ES256', private_keys={'old': old_key}, active_kid='old'
+    )
+    token = old_ring.sign({'sub': 'user'})
+    new_ring = KeyRing(
+        algorithm='ES256',
+        private_keys={'new': make_key()},
+        public_keys={'old': old_key.public_key()},
+        active_kid='new',
+    )
+
+    assert new_ring.decode(token) == {'sub': 'user'}
+    assert [key['kid'] for key in new_ring.jwks()['keys']] == ['new', 'old']
+
+
+def test_asymmetric_key_ring_rejects_unknown_kid():
+    signer = KeyRing(
+        algorithm='ES256', private_keys={'a': make_key()}, active_kid='a'
+    )
+    verifier = KeyRing(
+        algorithm='ES256', private_keys={'b': make_key()}, active_kid='b'
+    )
+
+    with pytest.raises(JWTError):
+        verifier.decode(signer.sign({'sub': 'user'}))
+
+
+def test_jwks_publishes_public_material_only():
+    key_ring = KeyRing(
+        algorithm='ES256', private_keys={'a': make_key()}, active_kid='a'
+    )
+
+    (published,) = key_ring.jwks()['keys']
+
+    assert published['kid'] == 'a'
+    assert published['kty'] == 'EC'
+    assert published['use'] == 'sig'
+    assert 'd' not in published
+
+
+def test_key_ring_requires_active_private_key():
+    with pytest.raises(ValueError, match='No private key'):
+        KeyRing(algorithm='ES256', public_keys={'a': make_key()})
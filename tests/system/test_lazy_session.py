@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import text
+
+from app.system.database.connection import Database
+from app.system.database.lazy_session import (
+    HoldStats,
+    LazySession,
+    release_connection,
+)
+
+
+@pytest.fixture
+async def scratch_database(tmp_path):
+    database = Database(f'sqlite+aiosqlite:///{tmp_path / "lazy.sqlite"}')
+    yield database
+    await database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unused_session_is_never_built():
+    def factory():
+        raise AssertionError('the session was built')
+
+    stats = HoldStats()
+    session = LazySession(factory, stats)
+    await release_connection(session)
+    await session.close()
+
+    assert stats.stats()['requests'] == 1
+    assert stats.stats()['requests_without_connection'] == 1
+    assert stats.stats()['holds'] == 0
+
+
+@pytest.mark.asyncio
+async def test_release_returns_the_connection(scratch_database):
+    stats = HoldStats()
+    session = LazySession(scratch_database.session, stats)
+
+    assert await session.scalar(text('SELECT 1')) == 1
+    assert scratch_database.checked_out == 1
+
+    await release_connection(session)
+    assert scratch_database.checked_out == 0
+    assert session.holds == 1
+
+    assert await session.scalar(text('SELECT 2')) == 2  # noqa: PLR2004
+    await session.close()
+
+    assert scratch_database.checked_out == 0
+    assert stats.stats()['holds'] == 2  # noqa: PLR2004
+    assert stats.stats()['requests'] == 1
+    assert stats.stats()['requests_without_connection'] == 0
+    assert session.held > 0
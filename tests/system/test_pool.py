@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.settings import get_config
+from app.system.database.pool import PoolStats, engine_options
+
+
+def test_engine_options_use_dialect_defaults():
+    options = engine_options(
+        'postgresql+asyncpg://user@db/app', get_config(), PoolStats()
+    )
+
+    assert options['pool_size'] == 10  # noqa: PLR2004
+    assert options['pool_pre_ping'] is True
+    assert options['connect_args'] == {'prepared_statement_cache_size': 100}
+
+
+def test_engine_options_apply_settings():
+    config = get_config()
+    config.DATABASE_POOL_SIZE = 2
+    config.DATABASE_POOL_PRE_PING = True
+    config.DATABASE_STATEMENT_CACHE_SIZE = 0
+
+    options = engine_options(
+        'sqlite+aiosqlite:///./app.sqlite', config, PoolStats()
+    )
+
+    assert options['pool_size'] == 2  # noqa: PLR2004
+    assert options['max_overflow'] == 10  # noqa: PLR2004
+    assert options['pool_pre_ping'] is True
+    assert options['connect_args'] == {'cached_statements': 0}
+
+
+def test_engine_options_keep_memory_sqlite_pool():
+    options = engine_options('sqlite+aiosqlite://', get_config(), PoolStats())
+
+    assert 'poolclass' not in options
+    assert 'pool_size' not in options
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_checkouts_and_timeouts(tmp_path):
+    config = get_config()
+    config.DATABASE_POOL_SIZE = 1
+    config.DATABASE_MAX_OVERFLOW = 0
+    config.DATABASE_POOL_TIMEOUT = 0.05
+    stats = PoolStats()
+    url = f'sqlite+aiosqlite:///{tmp_path / "pool.sqlite"}'
+    engine = create_async_engine(url, **engine_options(url, config, stats))
+
+    async with engine.connect():
+        busy = stats.stats(engine.pool)
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+    await engine.dispose()
+
+    after = stats.stats(engine.pool)
+    assert busy['checked_out'] == 1
+    assert after['checkouts'] == after['failures'] == after['timeouts'] == 1
+    assert after['checked_out'] == 0
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.system.cache.memory import MemoryBackend
+from app.system.cache.redis import (
+    BroadcastBackend,
+    RedisBackend,
+    RedisClient,
+    dumps,
+    loads,
+)
+from tests.system.resp_server import RespServer
+
+
+@pytest_asyncio.fixture
+async def resp_server():
+    server = RespServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def make_worker(url: str) -> BroadcastBackend:
+    return BroadcastBackend(
+        local=MemoryBackend(max_size=100, ttl=5),
+        shared=RedisBackend(RedisClient(url), ttl=60, prefix='test:'),
+        channel='invalidation:test',
+    )
+
+
+async def wait_for(condition, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError('condition not met in time')
+        await asyncio.sleep(0.001)
+
+
+def test_serialization_round_trips_snapshot_types():
+    snapshot = {
+        'uuid': uuid4(),
+        'email': 'user@example.com',
+        'date_of_birth': datetime(1995, 5, 20, tzinfo=timezone.utc),
+        'born_on': date(1995, 5, 20),
+        'social_name': None,
+    }
+
+    assert loads(dumps(snapshot)) == snapshot
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_get_set_delete(resp_server):
+    backend = RedisBackend(RedisClient(resp_server.url), ttl=60, prefix='t:')
+    user_id = uuid4()
+
+    await backend.set('key', {'uuid': user_id})
+    assert await backend.get('key') == {'uuid': user_id}
+
+    await backend.delete('key')
+    assert await backend.get('key') is None
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_get_many(resp_server):
+    backend = RedisBackend(RedisClient(resp_server.url), ttl=60, prefix='t:')
+    await backend.set('a', 1)
+    await backend.set('c', 3)
+
+    assert await backend.get_many(['a', 'b', 'c']) == [1, None, 3]
+    assert await backend.get_many([]) == []
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_clear_only_touches_prefix(resp_server):
+    backend = RedisBackend(RedisClient(resp_server.url), ttl=60, prefix='t:')
+    await backend.set('first', 1)
+    await backend.set('second', 2)
+    await backend.client.execute('SET', 'other:key', 'kept')
+
+    await backend.clear()
+
+    assert await backend.get('first') is None
+    assert await backend.client.execute('GET', 'other:key') == b'kept'
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_command_does_not_leak_its_reply(resp_server):
+    backend = RedisBackend(RedisClient(resp_server.url), ttl=60, prefix='t:')
+    await backend.set('a', {'v': 'A'})
+    await backend.set('b', {'v': 'B'})
+
+    resp_server.reply_delay = 0.05
+    pending = asyncio.create_task(backend.get('a'))
+    await asyncio.sleep(0.01)
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    resp_server.reply_delay = 0.0
+
+    assert await backend.get('b') == {'v': 'B'}
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_backend_survives_redis_outage():
+    server = RespServer()
+    await server.start()
+    await server.stop()
+    worker = make_worker(server.url)
+
+    assert await worker.get('key') is None
+    assert await worker.get_many(['key', 'other']) == [None, None]
+    await worker.set('key', {'v': 1})
+    await worker.delete('key')
+
+    assert worker.backend_errors == 4  # noqa: PLR2004
+    await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_backend_invalidates_other_workers(resp_server):
+    writer = make_worker(resp_server.url)
+    reader = make_worker(resp_server.url)
+    await writer.set('user', {'name': 'old'})
+    assert await reader.get('user') == {'name': 'old'}
+    assert await reader.local.get('user') == {'name': 'old'}
+
+    await writer.set('user', {'name': 'new'})
+
+    await wait_for(lambda: reader.local.cache.get('user') is None)
+    assert await reader.get('user') == {'name': 'new'}
+
+    await writer.delete('user')
+
+    await wait_for(lambda: reader.local.cache.get('user') is None)
+    assert await reader.get('user') is None
+    await writer.close()
+    await reader.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_backend_get_many_fills_local_copy(resp_server):
+    writer = make_worker(resp_server.url)
+    reader = make_worker(resp_server.url)
+    await writer.set('a', 1)
+    await writer.set('b', 2)
+    assert await reader.get('a') == 1
+
+    assert await reader.get_many(['a', 'b', 'missing']) == [1, 2, None]
+    assert await reader.local.get('b') == 2  # noqa: PLR2004
+    await writer.close()
+    await reader.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_backend_ignores_own_messages(resp_server):
+    worker = make_worker(resp_server.url)
+    await worker.get('warmup')
+    await worker.set('user', {'name': 'cached'})
+    await asyncio.sleep(0.01)
+
+    assert worker.invalidations_received == 0
+    assert await worker.local.get('user') == {'name': 'cached'}
+    await worker.close()
@@ -0,0 +1,160 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from app.auth import models as auth_models  # noqa: F401
+from app.auth import repository as auth_repository
+from app.auth.repository import AuthRepository
+from app.system.cache.memory import MemoryBackend
+from app.system.database.connection import Database, database
+from app.system.database.replicas import ReadRouter
+from app.system.security.security import get_password_hash
+from app.user import repository as user_repository
+from app.user.models import Base, User
+from app.user.repository import UserRepository
+from app.user.schema import BaseUserSchema
+
+PASSWORD = 'SecurePass!'
+
+
+class FakeReplica:
+    def __init__(self, name: str, checked_out: int):
+        self.name = name
+        self.checked_out = checked_out
+
+
+def make_router(primary, replicas, policy='round_robin') -> ReadRouter:
+    return ReadRouter(
+        primary=primary,
+        replicas=replicas,
+        policy=policy,
+        recent_writes=MemoryBackend(max_size=100, ttl=5),
+    )
+
+
+def test_round_robin_and_least_connections():
+    first, second = FakeReplica('first', 3), FakeReplica('second', 1)
+
+    round_robin = make_router('primary', [first, second])
+    least = make_router('primary', [first, second], 'least_connections')
+
+    assert [round_robin.pick().name for _ in range(3)] == [
+        'first',
+        'second',
+        'first',
+    ]
+    assert least.pick() is second
+    assert make_router('primary', []).pick() == 'primary'
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError, match='random'):
+        make_router('primary', [], 'random')
+
+
+@pytest.fixture
+async def lagging_replica(tmp_path, monkeypatch):
+    """
+    A primary and a replica in two SQLite files, the replica holding an
+    older copy of the user.
+    """
+    primary = Database(f'sqlite+aiosqlite:///{tmp_path / "primary.sqlite"}')
+    replica = Database(f'sqlite+aiosqlite:///{tmp_path / "replica.sqlite"}')
+    user = User(
+        email='replicated@example.com',
+        first_name='Current',
+        last_name='User',
+        date_of_birth=date(1990, 1, 1),
+        password=get_password_hash(PASSWORD),
+    )
+    for database in (primary, replica):
+        async with database.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    async with primary.session() as session:
+        session.add(user)
+        await session.commit()
+    async with replica.session() as session:
+        session.add(
+            User(
+                uuid=user.uuid,
+                email=user.email,
+                first_name='Stale',
+                last_name='User',
+                date_of_birth=user.date_of_birth,
+                password=user.password,
+            )
+        )
+        await session.commit()
+
+    router = make_router(primary, [replica])
+    monkeypatch.setattr(user_repository, 'read_router', router)
+    monkeypatch.setattr(auth_repository, 'read_router', router)
+    yield primary, replica, user
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_until_own_write(lagging_replica):
+    primary, replica, user = lagging_replica
+    async with primary.session() as db_session, replica.session() as read:
+        repository = UserRepository(
+            db_session=db_session, cache=None, read_session=read
+        )
+
+        before = await repository.get_user_by_id(user.uuid)
+        await repository.update_user(
+            user.uuid,
+            BaseUserSchema(
+                email=user.email,
+                first_name='Updated',
+                last_name='User',
+                date_of_birth=user.date_of_birth,
+            ),
+        )
+        after = await repository.get_user_by_id(user.uuid)
+        response, version = await repository.get_user_response(user.uuid)
+
+    assert before.first_name == 'Stale'
+    assert after.first_name == response.first_name == 'Updated'
+    assert version == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_login_falls_back_to_primary(lagging_replica):
+    primary, replica, user = lagging_replica
+    async with primary.session() as session:
+        await session.execute(
+            update(User)
+            .where(User.uuid == user.uuid)
+            .values(password=get_password_hash('ChangedPass!'))
+        )
+        await session.commit()
+
+    async with primary.session() as db_session, replica.session() as read:
+        repository = AuthRepository(db_session, read_session=read)
+        token = await repository.authenticate(user.email, 'ChangedPass!')
+
+    assert token.refresh_token
+
+
+@pytest.mark.asyncio
+async def test_failed_login_without_replicas_queries_once(monkeypatch):
+    lookups = []
+    select_login = AuthRepository._select_login
+
+    async def counting_select_login(session, email):
+        lookups.append(email)
+        return await select_login(session, email)
+
+    monkeypatch.setattr(
+        AuthRepository, '_select_login', staticmethod(counting_select_login)
+    )
+    async with database.session() as db_session, database.session() as read:
+        repository = AuthRepository(db_session, read_session=read)
+        with pytest.raises(HTTPException):
+            await repository.authenticate('nobody@example.com', PASSWORD)
+
+    assert lookups == ['nobody@example.com']
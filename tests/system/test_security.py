@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.system.security.security import (
+    PasswordHashPool,
+    get_password_hash,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async():
+    hashed = await hash_password_async('SecurePass!')
+
+    assert verify_password('SecurePass!', hashed)
+    assert await verify_password_async('SecurePass!', hashed)
+    assert not await verify_password_async('WrongPass!', hashed)
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_runs_off_event_loop():
+    pool = PasswordHashPool(kind='thread', workers=1, queue_depth=0)
+    loop_thread = threading.get_ident()
+
+    worker_thread = await pool.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_rejects_when_queue_is_full():
+    pool = PasswordHashPool(kind='thread', workers=1, queue_depth=1)
+    release = threading.Event()
+    jobs = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(release.wait)
+
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    release.set()
+    await asyncio.gather(*jobs)
+    assert pool.in_flight == 0
+    pool.shutdown()
+
+
+def test_password_needs_rehash():
+    stale_hash = Argon2Hasher(time_cost=1, memory_cost=8192).hash('Pass!1')
+
+    assert password_needs_rehash(stale_hash)
+    assert not password_needs_rehash(get_password_hash('Pass!1'))
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from app.system.cache.single_flight import SingleFlight
+
+CONCURRENCY = 10
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'value': 1}
+
+    results = await asyncio.gather(
+        *(flight.do('key', load) for _ in range(CONCURRENCY))
+    )
+
+    assert results == [{'value': 1}] * CONCURRENCY
+    assert len(calls) == 1
+    assert flight.stats() == {
+        'calls': 1,
+        'coalesced': CONCURRENCY - 1,
+        'in_flight': 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_single_flight_keeps_keys_apart_and_forgets_results():
+    flight = SingleFlight()
+
+    async def load(value):
+        await asyncio.sleep(0)
+        return value
+
+    assert await asyncio.gather(
+        flight.do('a', lambda: load('a')), flight.do('b', lambda: load('b'))
+    ) == ['a', 'b']
+    assert await flight.do('a', lambda: load('again')) == 'again'
+    assert flight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise LookupError('boom')
+
+    results = await asyncio.gather(
+        flight.do('key', fail), flight.do('key', fail), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [LookupError] * 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_retries_when_leader_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    leader = asyncio.create_task(flight.do('key', load))
+    await started.wait()
+    follower = asyncio.create_task(flight.do('key', load))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 2  # noqa: PLR2004
+    assert leader.cancelled()
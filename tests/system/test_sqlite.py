@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import exc, text
+
+from app.auth import models as auth_models  # noqa: F401
+from app.config.settings import get_config
+from app.system.cache.memory import MemoryBackend
+from app.system.database.connection import Database
+from app.system.database.replicas import ReadRouter
+from app.system.database.sqlite import (
+    WRITER_POOL,
+    is_sqlite_file,
+    production_pragmas,
+)
+from app.user.models import Base
+
+SYNCHRONOUS_NORMAL = 1
+
+
+def test_is_sqlite_file():
+    assert is_sqlite_file('sqlite+aiosqlite:///./app.sqlite')
+    assert not is_sqlite_file('sqlite+aiosqlite://')
+    assert not is_sqlite_file('postgresql+asyncpg://user@db/app')
+
+
+@pytest.fixture
+async def writer_and_reader(tmp_path):
+    url = f'sqlite+aiosqlite:///{tmp_path / "production.sqlite"}'
+    pragmas = production_pragmas(get_config())
+    writer = Database(url, pool=WRITER_POOL, pragmas=pragmas)
+    reader = Database(url, pragmas=(*pragmas, 'PRAGMA query_only=ON'))
+    async with writer.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text('CREATE TABLE items (name TEXT)'))
+    yield writer, reader
+    await writer.dispose()
+    await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_production_pragmas_are_set(writer_and_reader):
+    writer, _ = writer_and_reader
+    config = get_config()
+
+    async with writer.engine.connect() as conn:
+        journal_mode = await conn.scalar(text('PRAGMA journal_mode'))
+        synchronous = await conn.scalar(text('PRAGMA synchronous'))
+        busy_timeout = await conn.scalar(text('PRAGMA busy_timeout'))
+        foreign_keys = await conn.scalar(text('PRAGMA foreign_keys'))
+
+    assert journal_mode == 'wal'
+    assert synchronous == SYNCHRONOUS_NORMAL
+    assert busy_timeout == config.SQLITE_BUSY_TIMEOUT
+    assert foreign_keys == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_has_one_connection(writer_and_reader):
+    writer, _ = writer_and_reader
+
+    await writer.warm_up(connections=2)
+
+    assert writer.ready
+    assert writer.engine.pool.size() == 1
+    assert writer.engine.pool.checkedin() == 1
+
+
+@pytest.mark.asyncio
+async def test_reader_sees_commits_but_cannot_write(writer_and_reader):
+    writer, reader = writer_and_reader
+    async with writer.session() as session:
+        await session.execute(text("INSERT INTO items VALUES ('first')"))
+        await session.commit()
+
+    async with reader.session() as session:
+        names = (await session.scalars(text('SELECT name FROM items'))).all()
+        with pytest.raises(exc.OperationalError, match='readonly'):
+            await session.execute(text("INSERT INTO items VALUES ('x')"))
+
+    assert names == ['first']
+
+
+@pytest.mark.asyncio
+async def test_router_without_read_your_writes():
+    router = ReadRouter(
+        primary='writer',
+        replicas=['reader'],
+        policy='round_robin',
+        recent_writes=MemoryBackend(max_size=100, ttl=5),
+        read_your_writes=False,
+    )
+
+    await router.note_write('user')
+
+    assert not await router.wrote_recently('user')
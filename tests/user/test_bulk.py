@@ -0,0 +1,134 @@
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select
+
+from app.system.database.connection import database
+from app.system.database.lazy_session import HoldStats, LazySession
+from app.user import bulk
+from app.user.bulk import BulkImporter, format_for_content_type, iter_records
+from app.user.models import User
+
+
+async def chunked(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+NDJSON = b"""{"email": "bulk1@example.com", "first_name": "Bulk", "last_name": "One", "date_of_birth": "1990-01-01", "password": "SecurePass!"}
+not json
+{"email": "bulk1@example.com", "first_name": "Bulk", "last_name": "Again", "date_of_birth": "1990-01-01", "password": "SecurePass!"}
+
+{"email": "bulk2@example.com", "first_name": "B", "last_name": "Two", "date_of_birth": "1990-01-01", "password": "SecurePass!"}
+{"email": "validuser@example.com", "first_name": "Taken", "last_name": "Email", "date_of_birth": "1990-01-01", "password": "SecurePass!"}
+{"email": "bulk3@example.com", "first_name": "Bulk", "last_name": "Three", "date_of_birth": "1990-01-01", "password": "SecurePass!"}
+"""  # noqa: E501
+
+CSV = b"""email,first_name,last_name,social_name,date_of_birth,password\r
+bulk4@example.com,Bulk,Four,,1990-01-01,SecurePass!\r
+bulk5@example.com,Bulk\r
+"""
+
+
+@pytest.fixture
+async def cleanup_bulk_users(db_session):
+    yield
+    await db_session.execute(delete(User).where(User.email.like('bulk%')))
+    await db_session.commit()
+
+
+def test_format_for_content_type():
+    assert format_for_content_type('text/csv; charset=utf-8') == 'csv'
+    assert format_for_content_type('application/x-ndjson') == 'ndjson'
+    with pytest.raises(HTTPException) as exc_info:
+        format_for_content_type('application/json')
+    assert (
+        exc_info.value.status_code
+        == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_records_reads_csv_across_chunks():
+    records = await collect(iter_records(chunked(CSV), 'csv'))
+
+    assert records == [
+        (
+            2,
+            {
+                'email': 'bulk4@example.com',
+                'first_name': 'Bulk',
+                'last_name': 'Four',
+                'social_name': None,
+                'date_of_birth': '1990-01-01',
+                'password': 'SecurePass!',
+            },
+            None,
+        ),
+        (3, None, 'Expected 6 fields, got 2.'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_reports_bad_rows(
+    db_session, create_user, cleanup_bulk_users
+):
+    importer = BulkImporter(db_session, batch_size=2, hash_concurrency=2)
+
+    result = await importer.run(iter_records(chunked(NDJSON), 'ndjson'))
+
+    assert (result.created, result.failed) == (2, 4)
+    assert [(error.row, error.email) for error in result.errors] == [
+        (2, None),
+        (3, 'bulk1@example.com'),
+        (5, 'bulk2@example.com'),
+        (6, 'validuser@example.com'),
+    ]
+    assert result.errors[1].detail == 'Duplicate email in upload.'
+    assert result.errors[3].detail == 'Email already registered.'
+
+    emails = await db_session.execute(
+        select(User.email).where(User.email.like('bulk%')).order_by(User.email)
+    )
+    assert emails.scalars().all() == ['bulk1@example.com', 'bulk3@example.com']
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_skips_emails_from_earlier_runs(
+    db_session, cleanup_bulk_users
+):
+    importer = BulkImporter(db_session, batch_size=10, hash_concurrency=1)
+    await importer.run(iter_records(chunked(CSV), 'csv'))
+
+    result = await importer.run(iter_records(chunked(CSV), 'csv'))
+
+    assert result.created == 0
+    assert [error.detail for error in result.errors] == [
+        'Email already registered.',
+        'Expected 6 fields, got 2.',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_returns_connection_while_hashing(
+    cleanup_bulk_users, monkeypatch
+):
+    checked_out = []
+    hash_password_async = bulk.hash_password_async
+
+    async def hash_and_record(password):
+        checked_out.append(database.checked_out)
+        return await hash_password_async(password)
+
+    monkeypatch.setattr(bulk, 'hash_password_async', hash_and_record)
+    session = LazySession(database.session, HoldStats())
+    importer = BulkImporter(session, batch_size=10, hash_concurrency=1)
+
+    result = await importer.run(iter_records(chunked(CSV), 'csv'))
+    await session.close()
+
+    assert result.created == 1
+    assert checked_out == [0]
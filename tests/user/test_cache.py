@@ -0,0 +1,144 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.config.base_config import BaseConfig
+from app.system.cache.memory import MemoryBackend
+from app.user.cache import UserCache
+
+
+def make_snapshot(**overrides):
+    return {'uuid': uuid4(), 'email': 'cached@example.com', **overrides}
+
+
+@pytest.mark.asyncio
+async def test_user_cache_reads_through_once():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    snapshot = make_snapshot()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return snapshot
+
+    assert await cache.get_by_id(snapshot['uuid'], loader) == snapshot
+    assert await cache.get_by_id(snapshot['uuid'], loader) == snapshot
+    assert await cache.get_by_email(snapshot['email'], loader) == snapshot
+    assert len(calls) == 1
+    assert cache.stats() == {
+        'size': 2,
+        'hits': 2,
+        'misses': 1,
+        'hit_ratio': 2 / 3,
+        'coalesced': 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_user_cache_coalesces_concurrent_misses():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    snapshot = make_snapshot()
+    release = asyncio.Event()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await release.wait()
+        return snapshot
+
+    concurrency = 5
+    lookups = [
+        asyncio.ensure_future(cache.get_by_id(snapshot['uuid'], loader))
+        for _ in range(concurrency)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*lookups) == [snapshot] * concurrency
+    assert len(calls) == 1
+    assert cache.stats()['coalesced'] == concurrency - 1
+
+
+@pytest.mark.asyncio
+async def test_user_cache_invalidate_drops_id_and_email():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    snapshot = make_snapshot()
+    await cache.store(snapshot)
+
+    await cache.invalidate(snapshot['uuid'])
+
+    assert await cache.backend.get(f'user:id:{snapshot["uuid"]}') is None
+    assert await cache.backend.get(f'user:email:{snapshot["email"]}') is None
+
+
+@pytest.mark.asyncio
+async def test_user_cache_ignores_stale_email_pointer():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    snapshot = make_snapshot(email='old@example.com')
+    await cache.store(snapshot)
+    await cache.store({**snapshot, 'email': 'new@example.com'})
+
+    async def loader():
+        return None
+
+    assert await cache.get_by_email('old@example.com', loader) is None
+
+
+@pytest.mark.asyncio
+async def test_user_cache_does_not_store_load_racing_invalidation():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    snapshot = make_snapshot()
+
+    async def loader():
+        await cache.invalidate(snapshot['uuid'])
+        return snapshot
+
+    assert await cache.get_by_id(snapshot['uuid'], loader) == snapshot
+    assert cache.backend.size() == 0
+
+
+@pytest.mark.asyncio
+async def test_user_cache_get_many_loads_only_misses():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    cached = make_snapshot(email='cached@example.com')
+    loaded = make_snapshot(email='loaded@example.com')
+    unknown = uuid4()
+    await cache.store(cached)
+    requested = []
+
+    async def loader(user_ids):
+        requested.extend(user_ids)
+        return [loaded]
+
+    found = await cache.get_many(
+        [cached['uuid'], loaded['uuid'], unknown], loader
+    )
+
+    assert found == {cached['uuid']: cached, loaded['uuid']: loaded}
+    assert requested == [loaded['uuid'], unknown]
+    assert await cache.backend.get(f'user:id:{loaded["uuid"]}') == loaded
+
+
+@pytest.mark.asyncio
+async def test_user_cache_email_lookup_ignores_case():
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    snapshot = make_snapshot(email='Cached@Example.com')
+    await cache.store(snapshot)
+
+    async def loader():
+        return None
+
+    assert await cache.get_by_email('cached@example.COM', loader) == snapshot
+
+
+@pytest.mark.parametrize(
+    ('backend', 'enabled'), [('memory', False), ('redis', True)]
+)
+def test_user_cache_defaults_on_only_when_shared(
+    monkeypatch, backend, enabled
+):
+    monkeypatch.delenv('USER_CACHE_ENABLED', raising=False)
+    monkeypatch.setenv('CACHE_BACKEND', backend)
+
+    assert BaseConfig().USER_CACHE_ENABLED is enabled
@@ -7,8 +7,11 @@ from httpx import AsyncClient
 from sqlalchemy import select
 
 from app.config.settings import get_config
+from app.main import app
+from app.user import endpoints
 from app.user.models import User
-from app.user.schema import BaseUserSchema, UserCreate
+from app.user.schema import BaseUserSchema, TokenUser, UserCreate
+from app.user.utils.decode_user_token import get_current_user
 
 load_dotenv()
 ALGORITHM = get_config().ALGORITHM
@@ -58,6 +61,29 @@ async def test_get_user(client, create_user: User, setup_db):
     assert response.json()['last_name'] == create_user.last_name
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize('path', ['/user/{user_id}', '/user/me?fresh=true'])
+async def test_fast_read_path_matches_orm_path(
+    client: AsyncClient,
+    authenticated_as: TokenUser,
+    setup_db,
+    monkeypatch,
+    path,
+):
+    url = path.format(user_id=authenticated_as.uuid)
+    orm_response = await client.get(url)
+
+    monkeypatch.setattr(
+        endpoints, 'FAST_READ_ENDPOINTS', {'get_user', 'get_me'}
+    )
+    fast_response = await client.get(url)
+    missing = await client.get(f'/user/{uuid4()}')
+
+    assert fast_response.status_code == status.HTTP_200_OK
+    assert fast_response.json() == orm_response.json()
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.asyncio
 async def test_get_user_not_found(client: AsyncClient, setup_db):
     non_existent_user_id = uuid4()
@@ -88,6 +114,45 @@ async def test_update_user(client, create_user: User, setup_db):
     assert response.json()['last_name'] == updated_data.last_name
 
 
+@pytest.mark.asyncio
+async def test_get_user_if_none_match(
+    client: AsyncClient, create_user: User, setup_db
+):
+    path = f'/user/{create_user.uuid}'
+    etag = (await client.get(path)).headers['etag']
+
+    unchanged = await client.get(path, headers={'If-None-Match': etag})
+    stale = await client.get(path, headers={'If-None-Match': '"0", W/"9"'})
+
+    assert unchanged.status_code == status.HTTP_304_NOT_MODIFIED
+    assert unchanged.headers['etag'] == etag
+    assert not unchanged.content
+    assert stale.status_code == status.HTTP_200_OK
+    assert stale.headers['etag'] == etag
+
+
+@pytest.mark.asyncio
+async def test_update_user_if_match(
+    client: AsyncClient, create_user: User, setup_db
+):
+    path = f'/user/{create_user.uuid}'
+    etag = (await client.get(path)).headers['etag']
+    data = {
+        'email': create_user.email,
+        'first_name': 'Matched',
+        'last_name': 'Update',
+        'date_of_birth': '1995-05-20',
+    }
+
+    updated = await client.put(path, json=data, headers={'If-Match': etag})
+    conflict = await client.put(path, json=data, headers={'If-Match': etag})
+
+    assert updated.status_code == status.HTTP_200_OK
+    assert updated.headers['etag'] != etag
+    assert conflict.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert (await client.get(path)).headers['etag'] == updated.headers['etag']
+
+
 @pytest.mark.asyncio
 async def test_delete_user(client: AsyncClient, create_user: User, setup_db):
     response = await client.delete(f'/user/{create_user.uuid}')
@@ -103,3 +168,186 @@ async def test_delete_user_not_found(client: AsyncClient, setup_db):
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.json()['detail'] == 'user not found.'
+
+
+@pytest.fixture
+def authenticated_as(create_user: User):
+    current_user = TokenUser(
+        uuid=create_user.uuid,
+        email=create_user.email,
+        first_name=create_user.first_name,
+        last_name=create_user.last_name,
+    )
+    previous = app.dependency_overrides[get_current_user]
+    app.dependency_overrides[get_current_user] = lambda: current_user
+    yield current_user
+    app.dependency_overrides[get_current_user] = previous
+
+
+@pytest.mark.asyncio
+async def test_get_me_from_claims(
+    client: AsyncClient, authenticated_as: TokenUser, setup_db
+):
+    response = await client.get('/user/me')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['uuid'] == str(authenticated_as.uuid)
+    assert response.json()['email'] == authenticated_as.email
+    assert response.json()['date_of_birth'] is None
+
+
+@pytest.mark.asyncio
+async def test_get_me_fresh(
+    client: AsyncClient, authenticated_as: TokenUser, setup_db
+):
+    response = await client.get('/user/me', params={'fresh': True})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['uuid'] == str(authenticated_as.uuid)
+    assert response.json()['date_of_birth'] == '1995-05-20'
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_user_cache(
+    client: AsyncClient, create_user: User, setup_db
+):
+    await client.get(f'/user/{create_user.uuid}')
+    await client.get(f'/user/{create_user.uuid}')
+
+    response = await client.get('/metrics')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['user_cache']['hits'] >= 1
+    assert 'hit_ratio' in response.json()['user_cache']
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_users(client: AsyncClient, setup_db, db_session):
+    body = (
+        'email,first_name,last_name,date_of_birth,password\n'
+        'bulkapi@example.com,Bulk,Import,1990-01-01,SecurePass!\n'
+        'bulkapi@example.com,Bulk,Again,1990-01-01,SecurePass!\n'
+    )
+
+    response = await client.post(
+        '/user/bulk', content=body, headers={'Content-Type': 'text/csv'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['created'] == 1
+    assert response.json()['errors'] == [
+        {
+            'row': 3,
+            'email': 'bulkapi@example.com',
+            'detail': 'Duplicate email in upload.',
+        }
+    ]
+
+    result = await db_session.execute(
+        select(User).filter_by(email='bulkapi@example.com')
+    )
+    await db_session.delete(result.scalar_one())
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_rejects_unknown_format(
+    client: AsyncClient, setup_db
+):
+    response = await client.post(
+        '/user/bulk',
+        content='[]',
+        headers={'Content-Type': 'application/json'},
+    )
+
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+@pytest.mark.asyncio
+async def test_export_users(client: AsyncClient, create_user: User, setup_db):
+    response = await client.get(
+        '/user/export', params={'format': 'csv', 'gzip': True}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.headers['content-type'].startswith('text/csv')
+    assert str(create_user.uuid) in response.text
+
+
+@pytest.mark.asyncio
+async def test_export_users_resumable_requires_ndjson(
+    client: AsyncClient, setup_db
+):
+    response = await client.get(
+        '/user/export', params={'format': 'csv', 'resumable': True}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_list_users_follows_cursor(
+    client: AsyncClient, create_user: User, setup_db
+):
+    first = await client.get('/user/', params={'limit': 1})
+    assert first.status_code == status.HTTP_200_OK
+
+    emails = [item['email'] for item in first.json()['items']]
+    cursor = first.json()['next_cursor']
+    while cursor:
+        page = await client.get(
+            '/user/', params={'limit': 1, 'cursor': cursor}
+        )
+        emails += [item['email'] for item in page.json()['items']]
+        cursor = page.json()['next_cursor']
+
+    assert create_user.email in emails
+    assert emails == sorted(emails)
+
+
+@pytest.mark.asyncio
+async def test_list_users_rejects_bad_cursor(client: AsyncClient, setup_db):
+    response = await client.get('/user/', params={'cursor': 'garbage'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_users_batch(
+    client: AsyncClient, create_user: User, setup_db
+):
+    unknown = uuid4()
+
+    response = await client.get(
+        '/user/batch', params={'ids': f'{create_user.uuid},{unknown}'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    users = response.json()['users']
+    assert users[str(create_user.uuid)]['email'] == create_user.email
+    assert response.json()['missing'] == [str(unknown)]
+
+
+@pytest.mark.asyncio
+async def test_post_users_batch(
+    client: AsyncClient, create_user: User, setup_db
+):
+    response = await client.post(
+        '/user/batch', json={'ids': [str(create_user.uuid)]}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(response.json()['users']) == [str(create_user.uuid)]
+    assert response.json()['missing'] == []
+
+
+@pytest.mark.asyncio
+async def test_users_batch_limits(client: AsyncClient, setup_db):
+    too_many = await client.post(
+        '/user/batch', json={'ids': [str(uuid4()) for _ in range(101)]}
+    )
+    not_uuid = await client.get('/user/batch', params={'ids': 'nope'})
+
+    assert too_many.status_code == status.HTTP_400_BAD_REQUEST
+    assert not_uuid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
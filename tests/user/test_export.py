@@ -0,0 +1,94 @@
+import gzip
+import json
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+
+from app.user.export import cursor_position, export_users
+from app.user.models import User
+from app.user.utils.cursor import encode_cursor
+
+EXPORTED_USERS = 3
+
+
+@pytest.fixture
+async def exported_users(db_session):
+    users = [
+        User(
+            email=f'export{index}@example.com',
+            first_name='Export',
+            last_name=f'User{index}',
+            date_of_birth=date(1990, 1, index + 1),
+            password='not-a-real-hash',
+        )
+        for index in range(EXPORTED_USERS)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    yield users
+    await db_session.execute(delete(User).where(User.email.like('export%')))
+    await db_session.commit()
+
+
+async def read_all(**options) -> bytes:
+    return b''.join([chunk async for chunk in export_users(**options)])
+
+
+def ndjson_rows(data: bytes) -> list[dict]:
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_in_uuid_order(exported_users):
+    rows = ndjson_rows(await read_all(chunk_size=2))
+
+    uuids = [row['uuid'] for row in rows]
+    assert uuids == sorted(uuids)
+    exported = {row['email']: row for row in rows}
+    assert exported['export1@example.com']['date_of_birth'] == '1990-01-02'
+    assert 'password' not in exported['export1@example.com']
+
+
+@pytest.mark.asyncio
+async def test_export_csv_gzip(exported_users):
+    data = gzip.decompress(await read_all(format='csv', gzip=True))
+
+    header, *lines = data.decode().splitlines()
+    assert header.split(',') == [
+        'email',
+        'first_name',
+        'last_name',
+        'social_name',
+        'date_of_birth',
+        'uuid',
+    ]
+    assert sum('@example.com,Export,' in line for line in lines) == (
+        EXPORTED_USERS
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_resumes_from_checkpoint(exported_users):
+    complete = ndjson_rows(await read_all())
+    stream = export_users(chunk_size=1, resumable=True)
+    row, checkpoint = ndjson_rows(await anext(stream))
+    await stream.aclose()
+
+    rest = ndjson_rows(
+        await read_all(after=cursor_position(checkpoint['cursor']))
+    )
+
+    assert [row, *rest] == complete
+
+
+def test_cursor_position_rejects_garbage():
+    with pytest.raises(HTTPException, match='Invalid cursor'):
+        cursor_position('not-a-cursor')
+
+
+@pytest.mark.parametrize('position', ['nope', 42, None])
+def test_cursor_position_rejects_bad_uuid(position):
+    with pytest.raises(HTTPException, match='Invalid cursor'):
+        cursor_position(encode_cursor({'uuid': position}))
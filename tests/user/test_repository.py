@@ -1,13 +1,23 @@
+import asyncio
 from datetime import date
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import delete
 from sqlalchemy.future import select
 
-from app.user.models import User
-from app.user.repository import UserRepository
-from app.user.schema import BaseUserSchema, UserCreate
+from app.system.cache.memory import MemoryBackend
+from app.system.database.connection import database
+from app.user.cache import UserCache, user_snapshot
+from app.user.models import ResetPasswordToken, User
+from app.user.repository import UserRepository, user_lookups
+from app.user.schema import (
+    BaseUserSchema,
+    UserCreate,
+    UserFilter,
+    UserResponse,
+)
 
 ALGORITHM = 'HS256'
 SECRET_KEY = '3471f8db81f2c685a7edd5dbea62b6fb77987a548abe9ea42332998deb41b706'
@@ -64,6 +74,27 @@ async def test_get_user_by_id_not_found(db_session):
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.asyncio
+async def test_get_user_response(db_session, create_user):
+    repository = UserRepository(db_session)
+
+    response, version = await repository.get_user_response(create_user.uuid)
+
+    assert response == UserResponse.model_validate(
+        await repository.get_user_by_id(create_user.uuid)
+    )
+    assert version == 1
+    assert response.date_of_birth == date(1995, 5, 20)
+
+
+@pytest.mark.asyncio
+async def test_get_user_response_not_found(db_session):
+    repository = UserRepository(db_session)
+    with pytest.raises(HTTPException) as exc_info:
+        await repository.get_user_response(uuid4())
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.asyncio
 async def test_update_user(db_session, create_user):
     user = create_user
@@ -80,6 +111,35 @@ async def test_update_user(db_session, create_user):
     assert updated_user.email == update_data.email
 
 
+@pytest.mark.asyncio
+async def test_update_user_checks_expected_version(create_user):
+    # A rejected update rolls the session back, expiring create_user.
+    session = database.session()
+    repository = UserRepository(session)
+    update_data = BaseUserSchema(
+        email=create_user.email,
+        first_name='Versioned',
+        last_name='Doe',
+        date_of_birth='1995-05-20',
+    )
+
+    updated_user = await repository.update_user(
+        create_user.uuid, update_data, expected_versions={1}
+    )
+    updated_version = updated_user.version
+    with pytest.raises(HTTPException) as exc_info:
+        await repository.update_user(
+            create_user.uuid, update_data, expected_versions={1}
+        )
+
+    version = await repository.get_user_version(create_user.uuid)
+    await session.close()
+
+    assert updated_version == 2  # noqa: PLR2004
+    assert exc_info.value.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert version == 2  # noqa: PLR2004
+
+
 @pytest.mark.asyncio
 async def test_delete_user(db_session, create_user):
     user = create_user
@@ -90,6 +150,41 @@ async def test_delete_user(db_session, create_user):
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.asyncio
+async def test_update_user_not_found(db_session):
+    repository = UserRepository(db_session)
+    update_data = BaseUserSchema(
+        email='missing@example.com',
+        first_name='John',
+        last_name='Doe',
+        date_of_birth='1995-05-20',
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await repository.update_user(uuid4(), update_data)
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_delete_user_not_found(db_session):
+    repository = UserRepository(db_session)
+    with pytest.raises(HTTPException) as exc_info:
+        await repository.delete_user(uuid4())
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_delete_user_removes_reset_tokens(db_session, create_user):
+    db_session.add(ResetPasswordToken(user_id=create_user.uuid))
+    await db_session.commit()
+
+    await UserRepository(db_session).delete_user(create_user.uuid)
+
+    result = await db_session.execute(
+        select(ResetPasswordToken).filter_by(user_id=create_user.uuid)
+    )
+    assert result.scalars().all() == []
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email(db_session, create_user):
     user = create_user
@@ -101,3 +196,193 @@ async def test_get_user_by_email(db_session, create_user):
     assert fetched_user.email == user.email
     assert fetched_user.first_name == user.first_name
     assert fetched_user.last_name == user.last_name
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_is_cached(db_session, create_user):
+    repository = UserRepository(db_session)
+    await repository.get_user_by_id(create_user.uuid)
+    hits = repository.cache.hits
+
+    fetched_user = await repository.get_user_by_id(create_user.uuid)
+
+    assert repository.cache.hits == hits + 1
+    assert fetched_user.email == create_user.email
+
+
+@pytest.mark.asyncio
+async def test_update_user_refreshes_cache(db_session, create_user):
+    repository = UserRepository(db_session)
+    await repository.get_user_by_id(create_user.uuid)
+    update_data = BaseUserSchema(
+        email='cached@example.com',
+        first_name='Cached',
+        last_name='User',
+        date_of_birth='1995-05-20',
+    )
+
+    await repository.update_user(create_user.uuid, update_data)
+
+    fetched_user = await repository.get_user_by_id(create_user.uuid)
+    assert fetched_user.email == 'cached@example.com'
+    assert fetched_user.first_name == 'Cached'
+
+
+@pytest.mark.asyncio
+async def test_update_user_drops_snapshot_loaded_during_update(
+    db_session, create_user, monkeypatch
+):
+    cache = UserCache(MemoryBackend(max_size=10, ttl=60))
+    repository = UserRepository(db_session, cache=cache)
+    stale = user_snapshot(create_user)
+    release = asyncio.Event()
+    lookups = []
+
+    async def stale_loader():
+        await release.wait()
+        return stale
+
+    invalidate = cache.invalidate
+
+    async def invalidate_then_miss(user_id):
+        # A concurrent miss starts after the first invalidation and
+        # reads the row before the UPDATE commits.
+        await invalidate(user_id)
+        if not lookups:
+            lookups.append(
+                asyncio.ensure_future(cache.get_by_id(user_id, stale_loader))
+            )
+            await asyncio.sleep(0)
+
+    monkeypatch.setattr(cache, 'invalidate', invalidate_then_miss)
+    await repository.update_user(
+        create_user.uuid,
+        BaseUserSchema(
+            email=create_user.email,
+            first_name='Fresh',
+            last_name='User',
+            date_of_birth='1995-05-20',
+        ),
+    )
+    release.set()
+    await lookups[0]
+
+    cached = await cache.backend.get(f'user:id:{create_user.uuid}')
+    assert cached['first_name'] == 'Fresh'
+
+
+@pytest.fixture
+async def listed_users(db_session):
+    users = [
+        User(
+            email=f'list{index}@example.com',
+            first_name=first_name,
+            last_name='Lister',
+            date_of_birth=date(1990 + index, 1, 1),
+            password='not-a-real-hash',
+        )
+        for index, first_name in enumerate(['Ana', 'Bruno', 'Anabel'])
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    yield users
+    await db_session.execute(delete(User).where(User.email.like('list%')))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_list_users_pages_by_email(db_session, listed_users):
+    repository = UserRepository(db_session)
+    filters = UserFilter(email_prefix='list')
+
+    first, has_more = await repository.list_users(filters, None, limit=2)
+    second, has_more_after = await repository.list_users(
+        filters, first[-1].email, limit=2
+    )
+
+    assert [user.email for user in first + second] == [
+        'list0@example.com',
+        'list1@example.com',
+        'list2@example.com',
+    ]
+    assert (has_more, has_more_after) == (True, False)
+
+
+@pytest.mark.asyncio
+async def test_list_users_filters(db_session, listed_users):
+    repository = UserRepository(db_session)
+
+    by_name, _ = await repository.list_users(
+        UserFilter(name='ana'), None, limit=10
+    )
+    by_birth, _ = await repository.list_users(
+        UserFilter(
+            email_prefix='list',
+            born_from=date(1991, 1, 1),
+            born_to=date(1991, 1, 1),
+        ),
+        None,
+        limit=10,
+    )
+
+    assert [user.first_name for user in by_name] == ['Ana', 'Anabel']
+    assert [user.first_name for user in by_birth] == ['Bruno']
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids(db_session, listed_users):
+    repository = UserRepository(db_session)
+    await repository.get_user_by_id(listed_users[0].uuid)
+    unknown = uuid4()
+
+    users = await repository.get_users_by_ids(
+        [listed_users[0].uuid, listed_users[1].uuid, unknown]
+    )
+
+    assert {user_id: user.email for user_id, user in users.items()} == {
+        listed_users[0].uuid: 'list0@example.com',
+        listed_users[1].uuid: 'list1@example.com',
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_coalesces_without_cache(
+    db_session, create_user
+):
+    repository = UserRepository(db_session, cache=None)
+    coalesced = user_lookups.coalesced
+
+    users = await asyncio.gather(
+        repository.get_user_by_id(create_user.uuid),
+        repository.get_user_by_id(create_user.uuid),
+        repository.get_user_by_email(create_user.email),
+    )
+
+    assert {user.uuid for user in users} == {create_user.uuid}
+    assert user_lookups.coalesced == coalesced + 1
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_ignores_case(db_session, create_user):
+    repository = UserRepository(db_session)
+
+    fetched_user = await repository.get_user_by_email('ValidUser@Example.COM')
+
+    assert fetched_user.uuid == create_user.uuid
+    assert create_user.email_normalized == 'validuser@example.com'
+
+
+@pytest.mark.asyncio
+async def test_update_user_renormalizes_email(db_session, create_user):
+    repository = UserRepository(db_session)
+    update_data = BaseUserSchema(
+        email='Renamed@Example.com',
+        first_name='John',
+        last_name='Doe',
+        date_of_birth='1995-05-20',
+    )
+
+    user = await repository.update_user(create_user.uuid, update_data)
+
+    assert user.email == 'Renamed@Example.com'
+    assert user.email_normalized == 'renamed@example.com'
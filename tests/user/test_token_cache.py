@@ -0,0 +1,87 @@
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+from jose import jwt
+
+from app.config.settings import get_config
+from app.user.schema import TokenUser
+from app.user.utils.decode_user_token import get_current_user, token_cache
+from app.user.utils.token_cache import TokenCache
+
+ALGORITHM = get_config().ALGORITHM
+SECRET_KEY = get_config().SECRET_KEY
+
+
+def test_token_cache_hit_and_miss():
+    cache = TokenCache(max_size=10)
+    payload = {'sub': 'user', 'exp': int(time.time()) + 60}
+
+    assert cache.get('token') is None
+    cache.set('token', payload, payload['exp'])
+
+    assert cache.get('token') == payload
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_token_cache_evicts_expired_entries():
+    cache = TokenCache(max_size=10)
+    cache.set('token', {'sub': 'user'}, int(time.time()) - 1)
+
+    assert cache.get('token') is None
+    assert len(cache) == 0
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = TokenCache(max_size=2)
+    exp = int(time.time()) + 60
+    cache.set('first', 'first', exp)
+    cache.set('second', 'second', exp)
+    cache.get('first')
+    cache.set('third', 'third', exp)
+
+    assert cache.get('second') is None
+    assert cache.get('first') is not None
+    assert cache.get('third') is not None
+
+
+def test_token_cache_skips_tokens_without_exp():
+    cache = TokenCache(max_size=10)
+    cache.set('token', {'sub': 'user'}, None)
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_token_cache(db_session):
+    token_cache.clear()
+    user_id = uuid4()
+    token = jwt.encode(
+        {
+            'sub': str(user_id),
+            'exp': int(time.time()) + 60,
+            'user': {'email': 'user@example.com'},
+        },
+        SECRET_KEY,
+        ALGORITHM,
+    )
+
+    first = await get_current_user(token, db_session)
+    second = await get_current_user(token, db_session)
+
+    assert first == TokenUser(uuid=user_id, email='user@example.com')
+    assert second is first
+    assert token_cache.stats()['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_does_not_cache_invalid_tokens(db_session):
+    token_cache.clear()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user('not-a-token', db_session)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert len(token_cache) == 0